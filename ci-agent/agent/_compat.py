@@ -0,0 +1,11 @@
+"""
+Compatibility Module
+
+Feature switches for differences between the supported Python versions.
+"""
+
+import sys
+
+# dataclass(slots=...) is only available on Python 3.10+; older versions keep
+# a per-instance __dict__
+SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -177,6 +177,28 @@ class Config(BaseModel):
     autofix: AutofixConfig = Field(default_factory=AutofixConfig)
     performance: PerformanceConfig = Field(default_factory=PerformanceConfig)
     reporting: ReportingConfig = Field(default_factory=ReportingConfig)
+    
+    def apply_overrides(self, overrides: Dict[str, Any]) -> "Config":
+        """
+        Apply dotted-path overrides, e.g. {"general.mode": "autofix"}.
+        
+        All overrides are merged into one dump of the configuration and
+        validated together, rather than assigned field by field.
+        
+        Args:
+            overrides: Mapping of dotted field paths to new values
+            
+        Returns:
+            New configuration with the overrides applied (self if there are none)
+        """
+        if not overrides:
+            return self
+        
+        config_dict = self.model_dump()
+        for dotted_path, value in overrides.items():
+            set_nested_value(config_dict, dotted_path.split("."), value)
+        
+        return type(self)(**config_dict)
 
 
 def load_config(config_path: Union[str, Path] = None) -> Config:
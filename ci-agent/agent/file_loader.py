@@ -57,7 +57,8 @@ def find_workflow_files(
     workflow_paths: List[str],
     exclude_patterns: List[str] = None,
     max_file_size_kb: int = 500,
-    specific_file: Optional[Path] = None
+    specific_file: Optional[Path] = None,
+    specific_files: Optional[List[Path]] = None
 ) -> List[WorkflowFile]:
     """
     Find all workflow files in the specified paths.
@@ -68,6 +69,8 @@ def find_workflow_files(
         exclude_patterns: List of glob patterns to exclude
         max_file_size_kb: Maximum file size in KB
         specific_file: If provided, only analyze this specific file
+        specific_files: If provided, only analyze these files (together with
+            specific_file); discovery under workflow_paths is skipped
         
     Returns:
         List of discovered workflow files
@@ -77,23 +80,25 @@ def find_workflow_files(
     workflow_files: List[WorkflowFile] = []
     exclude_patterns = exclude_patterns or []
     
-    # If specific file is provided, only process that
-    if specific_file:
-        logger.info(f"📄 Processing specific file: {specific_file}")
-        if specific_file.exists():
-            size_kb = specific_file.stat().st_size / 1024
-            if size_kb <= max_file_size_kb:
-                wf = WorkflowFile(
-                    path=specific_file.resolve(),
-                    relative_path=specific_file,
-                    size_kb=size_kb
-                )
-                workflow_files.append(wf)
-                logger.info(f"✅ Found workflow file: {wf.relative_path} ({wf.size_kb:.1f}KB)")
+    # If specific files are provided, only process those
+    explicit_files = ([specific_file] if specific_file else []) + list(specific_files or [])
+    if explicit_files:
+        for explicit_file in explicit_files:
+            logger.info(f"📄 Processing specific file: {explicit_file}")
+            if explicit_file.exists():
+                size_kb = explicit_file.stat().st_size / 1024
+                if size_kb <= max_file_size_kb:
+                    wf = WorkflowFile(
+                        path=explicit_file.resolve(),
+                        relative_path=explicit_file,
+                        size_kb=size_kb
+                    )
+                    workflow_files.append(wf)
+                    logger.info(f"✅ Found workflow file: {wf.relative_path} ({wf.size_kb:.1f}KB)")
+                else:
+                    logger.warning(f"⚠️  File too large: {explicit_file} ({size_kb:.1f}KB > {max_file_size_kb}KB)")
             else:
-                logger.warning(f"⚠️  File too large: {specific_file} ({size_kb:.1f}KB > {max_file_size_kb}KB)")
-        else:
-            logger.error(f"❌ File not found: {specific_file}")
+                logger.error(f"❌ File not found: {explicit_file}")
         return workflow_files
     
     # Process each workflow path
@@ -0,0 +1,41 @@
+"""
+Line Index Module
+
+Maps character offsets in workflow content to line numbers without
+re-splitting the content for every lookup.
+"""
+
+from bisect import bisect_right
+from typing import List
+
+
+def compute_line_starts(content: str) -> List[int]:
+    """
+    Compute the offset at which each line of the content starts.
+    
+    Args:
+        content: Text to index
+        
+    Returns:
+        Sorted list of line start offsets (always begins with 0)
+    """
+    line_starts = [0]
+    index = content.find('\n')
+    while index != -1:
+        line_starts.append(index + 1)
+        index = content.find('\n', index + 1)
+    return line_starts
+
+
+def line_index_of(line_starts: List[int], pos: int) -> int:
+    """
+    Find the 0-based index of the line containing an offset.
+    
+    Args:
+        line_starts: Line start offsets from compute_line_starts
+        pos: Character offset into the content
+        
+    Returns:
+        Index into line_starts of the line containing pos
+    """
+    return bisect_right(line_starts, pos) - 1
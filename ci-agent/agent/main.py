@@ -15,6 +15,7 @@ import time
 from .config_loader import Config
 from .file_loader import find_workflow_files, load_all_files, filter_by_platform, WorkflowFile
 from .secrets_redactor import SecretsRedactor
+from .workflow_blob import WorkflowBlob
 from .exit_handler import ExitCode
 from .parsers.yaml_parser import YAMLParser
 from .analyzers.dag_analyzer import DAGAnalyzer
@@ -39,7 +40,8 @@ class CIOptimizerAgent:
         config: Config,
         target_path: Path,
         specific_file: Optional[Path] = None,
-        console: Optional[Console] = None
+        console: Optional[Console] = None,
+        specific_files: Optional[List[Path]] = None
     ):
         """
         Initialize the CI Optimizer Agent.
@@ -49,10 +51,13 @@ class CIOptimizerAgent:
             target_path: Path to analyze
             specific_file: Optional specific file to analyze
             console: Rich console for output
+            specific_files: Optional list of files to analyze instead of
+                discovering workflows under target_path
         """
         self.config = config
         self.target_path = target_path
         self.specific_file = specific_file
+        self.specific_files = specific_files
         self.console = console or Console()
         
         # Initialize components
@@ -166,7 +171,8 @@ class CIOptimizerAgent:
             workflow_paths=self.config.files.workflow_paths,
             exclude_patterns=self.config.files.exclude,
             max_file_size_kb=self.config.files.max_file_size,
-            specific_file=self.specific_file
+            specific_file=self.specific_file,
+            specific_files=self.specific_files
         )
         
         # Filter by platform
@@ -186,9 +192,12 @@ class CIOptimizerAgent:
         """
         logger.debug(f"Analyzing {workflow_file.relative_path}")
         
+        # Line index and digest are shared by the redactor and the parser
+        blob = WorkflowBlob.from_str(workflow_file.content)
+        
         # Secret detection
         if self.config.external_services.privacy.redact_secrets:
-            redacted_content, secrets = self.secrets_redactor.redact_content(workflow_file.content)
+            redacted_content, secrets = self.secrets_redactor.redact_content(blob)
             if secrets:
                 for secret in secrets:
                     self.issues.append({
@@ -203,7 +212,7 @@ class CIOptimizerAgent:
         
         # YAML parsing and validation
         parsed_workflow = self.yaml_parser.parse_workflow(
-            workflow_file.content,
+            blob,
             workflow_file.path
         )
         
@@ -6,22 +6,45 @@ Provides clear, actionable output with diffs and explanations.
 """
 
 import logging
+import operator
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import difflib
-from rich.console import Console, Group
-from rich.syntax import Syntax
+from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from rich.markdown import Markdown
-from rich.columns import Columns
 from dataclasses import dataclass
 
+from .._compat import SLOTS
+
 logger = logging.getLogger(__name__)
 
+# Static panels are built once at import rather than on every call
+_NO_ISSUES_PANEL = Panel(
+    Text.from_markup(
+        "[green]✅ No issues found![/green]\n\n"
+        "Your CI/CD configuration looks good. 🎉"
+    ),
+    title=Text.from_markup("[bold green]Analysis Complete[/bold green]"),
+    border_style="green"
+)
+
+# Pre-bound format templates for headers printed once per run or per file
+_ISSUE_COUNT_TEMPLATE = "❌ Found {n} issue{s}".format
+_FILE_HEADER_TEMPLATE = "[bold]{path}[/bold] [dim]({n} issue{s})[/dim]".format
+_FILE_RULE = "─" * 60
+
+# Width of the line-number gutter in code context output
+_LINE_NUM_WIDTH = 4
+
+
+def _plural(count: int) -> str:
+    """Return the plural suffix for a count."""
+    return '' if count == 1 else 's'
+
 
-@dataclass
+@dataclass(frozen=True, **SLOTS)
 class FormattedIssue:
     """Represents a formatted issue ready for display."""
     file_path: Path
@@ -61,6 +84,8 @@ class SuggestionFormatter:
         'performance': '🏃'
     }
     
+    _HEADER_SEPARATOR = Text(" • ")
+    
     def __init__(self, console: Optional[Console] = None, show_context: bool = True):
         """
         Initialize the suggestion formatter.
@@ -71,6 +96,16 @@ class SuggestionFormatter:
         """
         self.console = console or Console()
         self.show_context = show_context
+        
+        # Pre-styled header fragments so issues don't go through markup parsing
+        self._severity_text = {
+            severity: Text.assemble(f"{cfg['icon']} ", (cfg['label'], cfg['color']))
+            for severity, cfg in self.SEVERITY_CONFIG.items()
+        }
+        self._type_text = {
+            issue_type: Text(f"{icon} {issue_type.upper()}")
+            for issue_type, icon in self.TYPE_ICONS.items()
+        }
         logger.debug("Initialized suggestion formatter")
     
     def format_issues(
@@ -93,11 +128,15 @@ class SuggestionFormatter:
         
         # Convert to FormattedIssue objects
         formatted_issues = []
+        file_cache: Dict[Any, Tuple[Path, Optional[List[str]]]] = {}
         for issue in issues:
-            formatted = self._format_single_issue(issue, workflow_files)
+            formatted = self._format_single_issue(issue, workflow_files, file_cache)
             if formatted:
                 formatted_issues.append(formatted)
         
+        # Sort once so per-file groups come out already ordered by position
+        formatted_issues.sort(key=operator.attrgetter('file_path', 'line', 'column'))
+        
         # Display header
         self._display_header(len(formatted_issues))
         
@@ -165,7 +204,8 @@ class SuggestionFormatter:
     def _format_single_issue(
         self,
         issue: Dict[str, Any],
-        workflow_files: Dict[str, str]
+        workflow_files: Dict[str, str],
+        file_cache: Optional[Dict[Any, Tuple[Path, Optional[List[str]]]]] = None
     ) -> Optional[FormattedIssue]:
         """
         Format a single issue.
@@ -173,18 +213,32 @@ class SuggestionFormatter:
         Args:
             issue: Issue dictionary
             workflow_files: Workflow file contents
+            file_cache: Optional per-run cache of (path, lines) keyed by issue file
             
         Returns:
             FormattedIssue object or None
         """
         try:
-            file_path = Path(issue.get('file', ''))
+            if file_cache is None:
+                file_cache = {}
+            
+            # Resolve the path and split the content once per file, not per issue
+            file_key = issue.get('file', '')
+            cached = file_cache.get(file_key)
+            if cached is None:
+                file_path = Path(file_key)
+                content = workflow_files.get(str(file_path)) if self.show_context else None
+                cached = file_cache[file_key] = (
+                    file_path,
+                    content.splitlines() if content is not None else None
+                )
+            file_path, lines = cached
             
             # Get context lines if available
             context_lines = None
-            if self.show_context and str(file_path) in workflow_files:
+            if lines is not None:
                 context_lines = self._get_context_lines(
-                    workflow_files[str(file_path)],
+                    lines,
                     issue.get('line', 1),
                     context_size=2
                 )
@@ -206,7 +260,7 @@ class SuggestionFormatter:
     
     def _get_context_lines(
         self,
-        content: str,
+        lines: List[str],
         target_line: int,
         context_size: int = 2
     ) -> List[Tuple[int, str]]:
@@ -214,14 +268,13 @@ class SuggestionFormatter:
         Get context lines around a target line.
         
         Args:
-            content: File content
+            lines: File content split into lines
             target_line: Target line number (1-indexed)
             context_size: Number of lines before and after
             
         Returns:
             List of (line_number, line_content) tuples
         """
-        lines = content.splitlines()
         target_idx = target_line - 1
         
         start_idx = max(0, target_idx - context_size)
@@ -236,19 +289,15 @@ class SuggestionFormatter:
     
     def _display_no_issues(self) -> None:
         """Display message when no issues are found."""
-        panel = Panel(
-            "[green]✅ No issues found![/green]\n\n"
-            "Your CI/CD configuration looks good. 🎉",
-            title="[bold green]Analysis Complete[/bold green]",
-            border_style="green"
-        )
-        self.console.print(panel)
+        self.console.print(_NO_ISSUES_PANEL)
     
     def _display_header(self, issue_count: int) -> None:
         """Display the header for issues."""
-        self.console.print(
-            f"\n[bold red]❌ Found {issue_count} issue{'s' if issue_count != 1 else ''}[/bold red]\n"
-        )
+        self.console.print(Text.assemble(
+            "\n",
+            (_ISSUE_COUNT_TEMPLATE(n=issue_count, s=_plural(issue_count)), "bold red"),
+            "\n"
+        ))
     
     def _display_grouped_by_file(self, issues: List[FormattedIssue]) -> None:
         """Display issues grouped by file."""
@@ -264,7 +313,7 @@ class SuggestionFormatter:
         for file_path, file_issues in issues_by_file.items():
             self._display_file_header(file_path, len(file_issues))
             
-            for issue in sorted(file_issues, key=lambda x: (x.line, x.column)):
+            for issue in file_issues:
                 self._display_issue(issue)
             
             self.console.print()  # Empty line between files
@@ -277,27 +326,25 @@ class SuggestionFormatter:
     def _display_file_header(self, file_path: str, issue_count: int) -> None:
         """Display header for a file with issues."""
         self.console.print(
-            f"[bold]{file_path}[/bold] "
-            f"[dim]({issue_count} issue{'s' if issue_count != 1 else ''})[/dim]"
+            _FILE_HEADER_TEMPLATE(path=file_path, n=issue_count, s=_plural(issue_count))
         )
-        self.console.print("─" * 60)
+        self.console.print(_FILE_RULE)
     
     def _display_issue(self, issue: FormattedIssue, show_file: bool = False) -> None:
         """Display a single issue."""
         # Build issue header
-        severity_cfg = self.SEVERITY_CONFIG.get(issue.severity, self.SEVERITY_CONFIG['info'])
-        type_icon = self.TYPE_ICONS.get(issue.type, '❓')
+        type_text = self._type_text.get(issue.type) or Text(f"❓ {issue.type.upper()}")
         
         header_parts = [
-            f"{severity_cfg['icon']} [{severity_cfg['color']}]{severity_cfg['label']}[/{severity_cfg['color']}]",
-            f"{type_icon} {issue.type.upper()}",
-            f"Line {issue.line}:{issue.column}"
+            self._severity_text.get(issue.severity, self._severity_text['info']),
+            type_text,
+            Text(f"Line {issue.line}:{issue.column}")
         ]
         
         if show_file:
-            header_parts.insert(0, f"[dim]{issue.file_path}[/dim]")
+            header_parts.insert(0, Text(str(issue.file_path), style="dim"))
         
-        self.console.print("  " + " • ".join(header_parts))
+        self.console.print(Text.assemble("  ", self._HEADER_SEPARATOR.join(header_parts)))
         
         # Display message
         self.console.print(f"  [bold]{issue.message}[/bold]")
@@ -329,7 +376,7 @@ class SuggestionFormatter:
             is_target = line_num == target_line
             
             # Format line number
-            line_num_str = f"{line_num:4d}"
+            line_num_str = f"{line_num:{_LINE_NUM_WIDTH}d}"
             
             if is_target:
                 # Highlight the target line
@@ -339,7 +386,7 @@ class SuggestionFormatter:
                 
                 # Show column indicator
                 if target_column > 0:
-                    spaces = " " * (len(line_num_str) + target_column + 5)
+                    spaces = " " * (_LINE_NUM_WIDTH + target_column + 5)
                     self.console.print(f"  {spaces}[red]^[/red]")
             else:
                 self.console.print(
@@ -348,6 +395,9 @@ class SuggestionFormatter:
     
     def _display_diff(self, diff: str) -> None:
         """Display a diff."""
+        # Imported lazily: rich.syntax pulls in pygments, which most runs never need
+        from rich.syntax import Syntax
+        
         self.console.print("\n  [dim]Suggested change:[/dim]")
         
         # Use Syntax highlighting for the diff
@@ -396,6 +446,8 @@ class SuggestionFormatter:
     
     def _display_example(self, example: str) -> None:
         """Display a code example."""
+        from rich.syntax import Syntax
+        
         self.console.print("\n   [dim]Example:[/dim]")
         
         # Detect language from example content
@@ -409,6 +461,8 @@ class SuggestionFormatter:
     
     def _display_cache_config(self, cache_config: Dict[str, Any]) -> None:
         """Display suggested cache configuration."""
+        from rich.syntax import Syntax
+        
         self.console.print("\n   [dim]Suggested cache configuration:[/dim]")
         
         # Format as YAML
@@ -421,16 +475,17 @@ class SuggestionFormatter:
         
         if 'restore-keys' in cache_config:
             yaml_lines.append("    restore-keys: |")
-            for key in cache_config['restore-keys']:
-                yaml_lines.append(f"      {key}")
-        
-        if 'path' in cache_config:
-            if isinstance(cache_config['path'], list):
-                yaml_lines.append("    path: |")
-                for path in cache_config['path']:
-                    yaml_lines.append(f"      {path}")
-            else:
-                yaml_lines.append(f"    path: {cache_config['path']}")
+            yaml_lines.extend(f"      {key}" for key in cache_config['restore-keys'])
+        
+        # Normalize path to a list so single and multiple paths share one code path
+        paths = cache_config.get('path')
+        paths = paths if isinstance(paths, list) else ([paths] if paths else [])
+        
+        if len(paths) == 1:
+            yaml_lines.append(f"    path: {paths[0]}")
+        elif paths:
+            yaml_lines.append("    path: |")
+            yaml_lines.extend(f"      {path}" for path in paths)
         
         yaml_content = "\n".join(yaml_lines)
         syntax = Syntax(yaml_content, "yaml", theme="monokai", line_numbers=False)
@@ -470,9 +525,9 @@ class SuggestionFormatter:
                                        for t in set(types_for_severity))
                 
                 table.add_row(
-                    f"{cfg['icon']} {cfg['label']}",
-                    str(count),
-                    type_summary or "-"
+                    Text.assemble(f"{cfg['icon']} ", (cfg['label'], cfg['color'])),
+                    Text(str(count)),
+                    Text(type_summary or "-", style="dim")
                 )
         
         self.console.print("\n")
@@ -5,7 +5,10 @@ Handles parsing and validation of YAML workflow files.
 Provides schema validation and error detection capabilities.
 """
 
+import re
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 import yaml
@@ -14,10 +17,67 @@ import jsonschema
 from jsonschema import ValidationError
 from dataclasses import dataclass
 
+from .._compat import SLOTS
+from ..line_index import compute_line_starts, line_index_of
+from ..workflow_blob import WorkflowBlob
+
+try:
+    # libyaml-backed loader is several times faster when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    # Optional: compiles JSON schemas into plain Python validation code
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _load_numpy() -> Any:
+    """
+    Import numpy on first use; it only pays off for very large workflows.
+    
+    Returns:
+        The numpy module, or None if it isn't installed
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+# Mirrors the rules in YAMLParser._walk_github_actions: any workflow it
+# accepts raises none of them
+GITHUB_ACTIONS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["on", "jobs"],
+    "properties": {
+        "jobs": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "required": ["runs-on"],
+                "properties": {
+                    "steps": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "anyOf": [{"required": ["uses"]}, {"required": ["run"]}]
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+
+@dataclass(**SLOTS)
 class YAMLIssue:
     """Represents an issue found in a YAML file."""
     type: str  # 'syntax', 'schema', 'structure'
@@ -45,51 +105,138 @@ class YAMLParser:
     Handles syntax validation, schema validation, and common issue detection.
     """
     
+    # Single sweep for line-level problems; trailing whitespace is tried first
+    # so a run ending the line is reported as a whole
+    _LINE_ISSUE_RE = re.compile(
+        r'(?P<trail>[^\S\n]+$)|(?P<tab>\t)|(?P<runon>run-on:)|(?P<need>need:)',
+        re.MULTILINE
+    )
+    
+    # Content markers used to guess the platform when the path doesn't tell
+    _PLATFORM_MARKER_RE = re.compile(
+        r'(?P<on>on:)|(?P<jobs>jobs:)|(?P<stages>stages:)|(?P<gitlab>(?i:gitlab))'
+    )
+    
+    # Every byte except newline and the two quote characters, for bytes.translate
+    _NON_QUOTE_BYTES = bytes(b for b in range(256) if b not in (0x0A, 0x22, 0x27))
+    
+    # Suggestions for YAML errors, keyed by fragments that must all appear in
+    # the error's context/problem text; the first matching entry wins
+    _TAB_SUGGESTION = "Replace tabs with spaces (YAML doesn't allow tabs for indentation)"
+    _BRACKET_SUGGESTION = "Check for missing or extra colons, quotes, or brackets"
+    _YAML_ERROR_SUGGESTIONS: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+        (("found character '\\t'",), _TAB_SUGGESTION),
+        (("mapping values are not allowed",), "Check indentation and ensure proper key-value structure"),
+        (("expected", "found"), _BRACKET_SUGGESTION),
+        (("expected", "but got"), _BRACKET_SUGGESTION),
+        # libyaml's wording of the two entries above
+        (("did not find expected",), _BRACKET_SUGGESTION),
+    )
+    
+    # Alias reference at an error mark; libyaml doesn't name undefined aliases
+    _ALIAS_RE = re.compile(r'\*([^\s,\[\]{}]+)')
+    
+    # Content size from which line scans switch to NumPy when it is installed
+    VECTORIZE_MIN_SIZE = 100 * 1024
+    
+    # Number of parse results kept for repeated content
+    PARSE_CACHE_SIZE = 128
+    
+    # JSON schemas compiled with fastjsonschema the first time their platform is seen
+    COMPILED_SCHEMAS: Dict[str, Dict[str, Any]] = {'github_actions': GITHUB_ACTIONS_SCHEMA}
+    
     def __init__(self):
         """Initialize the YAML parser."""
-        self.yaml_loader = yaml.SafeLoader
+        self.yaml_loader = _SafeLoader
+        # LRU of (content digest, platform) -> ParsedWorkflow
+        self._parse_cache: "OrderedDict[Tuple[bytes, str], ParsedWorkflow]" = OrderedDict()
+        # Platform -> compiled validator, used to skip the detailed checks for
+        # valid workflows
+        self._compiled_validators: Dict[str, Any] = {}
+        # Platform -> structure/schema checker; other platforms have no checks
+        self._workflow_checkers = {
+            'github_actions': self._walk_github_actions,
+            'gitlab_ci': self._check_gitlab_ci,
+        }
         logger.debug("Initialized YAML parser")
     
-    def parse_workflow(self, content: str, file_path: Path = None) -> ParsedWorkflow:
+    def parse_workflow(self, content: Union[str, WorkflowBlob], file_path: Path = None) -> ParsedWorkflow:
         """
         Parse a workflow YAML file and validate its structure.
         
         Args:
-            content: The YAML content to parse
+            content: The YAML content to parse, or a WorkflowBlob shared with
+                other passes over the same content
             file_path: Optional path for better error messages
             
         Returns:
             ParsedWorkflow object with parsed data and any issues found
+        
+        Note:
+            Results are cached by content, so parsed_data may be shared between
+            calls with identical content and must be treated as read-only.
         """
         logger.debug(f"Parsing workflow{f' from {file_path}' if file_path else ''}")
         
+        blob = content if isinstance(content, WorkflowBlob) else WorkflowBlob.from_str(content)
+        content = blob.content
+        
+        platform = self._detect_platform(content, file_path)
+        cache_key = (blob.digest, platform)
+        
+        parsed = self._parse_cache.get(cache_key)
+        if parsed is not None:
+            logger.debug("Using cached parse result")
+            self._parse_cache.move_to_end(cache_key)
+        else:
+            parsed = self._parse_uncached(blob, platform)
+            self._parse_cache[cache_key] = parsed
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        
+        # Hand out a fresh object so callers can't alter the cached issue list
+        return ParsedWorkflow(
+            raw_content=content,
+            parsed_data=parsed.parsed_data,
+            issues=list(parsed.issues),
+            platform=parsed.platform,
+            is_valid=parsed.is_valid
+        )
+    
+    def _parse_uncached(self, blob: WorkflowBlob, platform: str) -> ParsedWorkflow:
+        """
+        Run the full parse and validation pipeline on workflow content.
+        
+        Args:
+            blob: The YAML content to parse
+            platform: Detected CI platform
+            
+        Returns:
+            ParsedWorkflow object with parsed data and any issues found
+        """
+        content = blob.content
         issues: List[YAMLIssue] = []
         parsed_data = None
-        platform = self._detect_platform(content, file_path)
         
         # Step 1: Parse YAML syntax
         try:
-            parsed_data = yaml.safe_load(content)
+            parsed_data = yaml.load(content, Loader=self.yaml_loader)
             logger.debug("YAML syntax is valid")
         except yaml.scanner.ScannerError as e:
-            issues.append(self._yaml_error_to_issue(e, "Scanner error"))
+            issues.append(self._yaml_error_to_issue(e, "Scanner error", content))
         except yaml.parser.ParserError as e:
-            issues.append(self._yaml_error_to_issue(e, "Parser error"))
+            issues.append(self._yaml_error_to_issue(e, "Parser error", content))
         except YAMLError as e:
-            issues.append(self._yaml_error_to_issue(e, "YAML error"))
+            issues.append(self._yaml_error_to_issue(e, "YAML error", content))
         
-        # Step 2: Validate structure if parsing succeeded
-        if parsed_data is not None:
-            # Check for common structural issues
-            structural_issues = self._check_structure(parsed_data, platform)
-            issues.extend(structural_issues)
-            
-            # Validate against schema if available
-            schema_issues = self._validate_schema(parsed_data, platform)
-            issues.extend(schema_issues)
+        # Step 2: Validate structure if parsing succeeded and the compiled
+        # schema (when available) didn't already vouch for it
+        if parsed_data is not None and not self._passes_compiled_schema(parsed_data, platform):
+            # Check for structural and schema issues
+            issues.extend(self._check_workflow_data(parsed_data, platform))
         
         # Step 3: Check for common YAML mistakes
-        syntax_issues = self._check_common_syntax_issues(content)
+        syntax_issues = self._check_common_syntax_issues(content, blob.line_starts)
         issues.extend(syntax_issues)
         
         # Determine if workflow is valid
@@ -121,21 +268,31 @@ class YAMLParser:
             elif file_path.name in ['.gitlab-ci.yml', '.gitlab-ci.yaml']:
                 return 'gitlab_ci'
         
-        # Try to detect from content
-        if 'on:' in content and 'jobs:' in content:
-            return 'github_actions'
-        elif 'stages:' in content or 'gitlab' in content.lower():
+        # Try to detect from content, scanning it once for all markers
+        seen = set()
+        for match in self._PLATFORM_MARKER_RE.finditer(content):
+            seen.add(match.lastgroup)
+            if 'on' in seen and 'jobs' in seen:
+                return 'github_actions'
+        
+        if 'stages' in seen or 'gitlab' in seen:
             return 'gitlab_ci'
         
         return 'unknown'
     
-    def _yaml_error_to_issue(self, error: YAMLError, error_type: str) -> YAMLIssue:
+    def _yaml_error_to_issue(
+        self,
+        error: YAMLError,
+        error_type: str,
+        content: Optional[str] = None
+    ) -> YAMLIssue:
         """
         Convert a YAML error to a YAMLIssue object.
         
         Args:
             error: The YAML error
             error_type: Type of error for the message
+            content: Optional YAML content the error was raised for
             
         Returns:
             YAMLIssue object
@@ -143,23 +300,39 @@ class YAMLParser:
         # Extract line and column from error if available
         line = 1
         column = 1
-        if hasattr(error, 'problem_mark'):
-            line = error.problem_mark.line + 1
-            column = error.problem_mark.column + 1
+        found_tab = False
+        problem = getattr(error, 'problem', None)
+        if getattr(error, 'problem_mark', None) is not None:
+            mark = error.problem_mark
+            line = mark.line + 1
+            column = mark.column + 1
+            # libyaml omits the offending character from its message, so look it up
+            if content is not None and 0 <= mark.index < len(content):
+                found_tab = content[mark.index] == '\t'
+                if problem == "found undefined alias":
+                    alias = self._ALIAS_RE.match(content, mark.index)
+                    if alias:
+                        problem = f"found undefined alias {alias.group(1)!r}"
         
         # Create error message
         message = f"{error_type}: {str(error)}"
         if hasattr(error, 'problem'):
-            message = f"{error_type}: {error.problem}"
+            message = f"{error_type}: {problem}"
         
-        # Generate suggestion based on error type
-        suggestion = None
-        if "found character '\\t'" in str(error):
-            suggestion = "Replace tabs with spaces (YAML doesn't allow tabs for indentation)"
-        elif "mapping values are not allowed" in str(error):
-            suggestion = "Check indentation and ensure proper key-value structure"
-        elif "expected" in str(error) and "found" in str(error):
-            suggestion = "Check for missing or extra colons, quotes, or brackets"
+        # Generate suggestion from the short context/problem fields; the full
+        # message also quotes the offending content, which could match by accident
+        if hasattr(error, 'problem'):
+            details = f"{error.context or ''} {problem or ''}"
+        else:
+            details = str(error)
+        
+        suggestion = self._TAB_SUGGESTION if found_tab else next(
+            (
+                hint for fragments, hint in self._YAML_ERROR_SUGGESTIONS
+                if all(fragment in details for fragment in fragments)
+            ),
+            None
+        )
         
         return YAMLIssue(
             type='syntax',
@@ -170,233 +343,350 @@ class YAMLParser:
             suggestion=suggestion
         )
     
-    def _check_structure(self, data: Dict[str, Any], platform: str) -> List[YAMLIssue]:
+    def _passes_compiled_schema(self, data: Any, platform: str) -> bool:
         """
-        Check for structural issues in the parsed YAML.
+        Check parsed data against the compiled platform schema.
         
         Args:
             data: Parsed YAML data
             platform: CI platform
             
         Returns:
-            List of structural issues found
+            True if the data is known to raise no structure or schema issues
         """
-        issues = []
+        if fastjsonschema is None or platform not in self.COMPILED_SCHEMAS:
+            return False
         
-        if platform == 'github_actions':
-            # Check for required top-level keys
-            if not isinstance(data, dict):
-                issues.append(YAMLIssue(
-                    type='structure',
-                    severity='high',
-                    line=1,
-                    column=1,
-                    message="Workflow must be a YAML mapping (key-value pairs)",
-                    suggestion="Ensure the file starts with 'name:' or 'on:' at the top level"
-                ))
-                return issues
-            
-            # Check for 'on' trigger
-            if 'on' not in data:
-                issues.append(YAMLIssue(
-                    type='structure',
-                    severity='high',
-                    line=1,
-                    column=1,
-                    message="Missing required 'on' trigger",
-                    suggestion="Add an 'on:' section to define when the workflow should run"
-                ))
+        validator = self._compiled_validators.get(platform)
+        if validator is None:
+            validator = fastjsonschema.compile(self.COMPILED_SCHEMAS[platform])
+            self._compiled_validators[platform] = validator
+        
+        try:
+            validator(data)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+    
+    def _check_workflow_data(self, data: Any, platform: str) -> List[YAMLIssue]:
+        """
+        Check parsed YAML for structural and schema issues.
+        
+        Args:
+            data: Parsed YAML data
+            platform: CI platform
             
-            # Check for 'jobs'
-            if 'jobs' not in data:
-                issues.append(YAMLIssue(
-                    type='structure',
-                    severity='high',
-                    line=1,
-                    column=1,
-                    message="Missing required 'jobs' section",
-                    suggestion="Add a 'jobs:' section to define the workflow jobs"
-                ))
-            elif not isinstance(data.get('jobs'), dict):
-                issues.append(YAMLIssue(
-                    type='structure',
-                    severity='high',
-                    line=1,
-                    column=1,
-                    message="'jobs' must be a mapping of job names to job definitions",
-                    suggestion="Define jobs as nested mappings under 'jobs:'"
-                ))
-            else:
-                # Check individual jobs
-                for job_name, job_def in data['jobs'].items():
-                    if not isinstance(job_def, dict):
-                        issues.append(YAMLIssue(
-                            type='structure',
-                            severity='high',
-                            line=1,
-                            column=1,
-                            message=f"Job '{job_name}' must be a mapping",
-                            suggestion=f"Define job '{job_name}' with 'runs-on' and 'steps'"
-                        ))
-                    elif 'runs-on' not in job_def:
-                        issues.append(YAMLIssue(
-                            type='structure',
-                            severity='high',
-                            line=1,
-                            column=1,
-                            message=f"Job '{job_name}' missing required 'runs-on'",
-                            suggestion=f"Add 'runs-on: ubuntu-latest' or another runner to job '{job_name}'"
-                        ))
+        Returns:
+            List of structural issues followed by schema issues
+        """
+        checker = self._workflow_checkers.get(platform)
+        return checker(data) if checker is not None else []
+    
+    def _check_gitlab_ci(self, data: Any) -> List[YAMLIssue]:
+        """
+        Check a GitLab CI configuration's structure.
         
-        elif platform == 'gitlab_ci':
-            # GitLab CI specific checks
-            if not isinstance(data, dict):
-                issues.append(YAMLIssue(
-                    type='structure',
-                    severity='high',
-                    line=1,
-                    column=1,
-                    message="GitLab CI configuration must be a YAML mapping",
-                    suggestion="Define jobs as top-level keys with their configurations"
-                ))
+        Args:
+            data: Parsed YAML data
+            
+        Returns:
+            List of structural issues
+        """
+        if not isinstance(data, dict):
+            return [YAMLIssue(
+                type='structure',
+                severity='high',
+                line=1,
+                column=1,
+                message="GitLab CI configuration must be a YAML mapping",
+                suggestion="Define jobs as top-level keys with their configurations"
+            )]
         
-        return issues
+        return []
     
-    def _validate_schema(self, data: Dict[str, Any], platform: str) -> List[YAMLIssue]:
+    def _walk_github_actions(self, data: Any) -> List[YAMLIssue]:
         """
-        Validate the YAML against platform-specific schema.
+        Check a GitHub Actions workflow's structure and steps in a single pass.
         
         Args:
             data: Parsed YAML data
-            platform: CI platform
             
         Returns:
-            List of schema validation issues
+            List of structural issues followed by schema issues
         """
-        issues = []
+        # Check for required top-level keys
+        if not isinstance(data, dict):
+            return [YAMLIssue(
+                type='structure',
+                severity='high',
+                line=1,
+                column=1,
+                message="Workflow must be a YAML mapping (key-value pairs)",
+                suggestion="Ensure the file starts with 'name:' or 'on:' at the top level"
+            )]
         
-        # For now, we'll do basic validation
-        # In a full implementation, we'd load actual JSON schemas for each platform
+        structure_issues = []
+        schema_issues = []
         
-        if platform == 'github_actions' and isinstance(data, dict):
-            # Validate job steps
-            jobs = data.get('jobs', {})
+        # Check for 'on' trigger
+        if 'on' not in data:
+            structure_issues.append(YAMLIssue(
+                type='structure',
+                severity='high',
+                line=1,
+                column=1,
+                message="Missing required 'on' trigger",
+                suggestion="Add an 'on:' section to define when the workflow should run"
+            ))
+        
+        # Check for 'jobs'
+        jobs = data.get('jobs')
+        if 'jobs' not in data:
+            structure_issues.append(YAMLIssue(
+                type='structure',
+                severity='high',
+                line=1,
+                column=1,
+                message="Missing required 'jobs' section",
+                suggestion="Add a 'jobs:' section to define the workflow jobs"
+            ))
+        elif not isinstance(jobs, dict):
+            structure_issues.append(YAMLIssue(
+                type='structure',
+                severity='high',
+                line=1,
+                column=1,
+                message="'jobs' must be a mapping of job names to job definitions",
+                suggestion="Define jobs as nested mappings under 'jobs:'"
+            ))
+        else:
+            # Check individual jobs and their steps
             for job_name, job_def in jobs.items():
-                if isinstance(job_def, dict) and 'steps' in job_def:
-                    steps = job_def['steps']
-                    if not isinstance(steps, list):
-                        issues.append(YAMLIssue(
+                if not isinstance(job_def, dict):
+                    structure_issues.append(YAMLIssue(
+                        type='structure',
+                        severity='high',
+                        line=1,
+                        column=1,
+                        message=f"Job '{job_name}' must be a mapping",
+                        suggestion=f"Define job '{job_name}' with 'runs-on' and 'steps'"
+                    ))
+                    continue
+                
+                if 'runs-on' not in job_def:
+                    structure_issues.append(YAMLIssue(
+                        type='structure',
+                        severity='high',
+                        line=1,
+                        column=1,
+                        message=f"Job '{job_name}' missing required 'runs-on'",
+                        suggestion=f"Add 'runs-on: ubuntu-latest' or another runner to job '{job_name}'"
+                    ))
+                
+                if 'steps' not in job_def:
+                    continue
+                
+                steps = job_def['steps']
+                if not isinstance(steps, list):
+                    schema_issues.append(YAMLIssue(
+                        type='schema',
+                        severity='high',
+                        line=1,
+                        column=1,
+                        message=f"Job '{job_name}' steps must be a list",
+                        suggestion="Define steps as a list with '- name: ...' or '- uses: ...'"
+                    ))
+                    continue
+                
+                for i, step in enumerate(steps):
+                    if not isinstance(step, dict):
+                        schema_issues.append(YAMLIssue(
                             type='schema',
                             severity='high',
                             line=1,
                             column=1,
-                            message=f"Job '{job_name}' steps must be a list",
-                            suggestion="Define steps as a list with '- name: ...' or '- uses: ...'"
+                            message=f"Step {i+1} in job '{job_name}' must be a mapping",
+                            suggestion="Each step should have 'name', 'uses', or 'run'"
                         ))
-                    else:
-                        for i, step in enumerate(steps):
-                            if not isinstance(step, dict):
-                                issues.append(YAMLIssue(
-                                    type='schema',
-                                    severity='high',
-                                    line=1,
-                                    column=1,
-                                    message=f"Step {i+1} in job '{job_name}' must be a mapping",
-                                    suggestion="Each step should have 'name', 'uses', or 'run'"
-                                ))
-                            elif not any(k in step for k in ['uses', 'run']):
-                                issues.append(YAMLIssue(
-                                    type='schema',
-                                    severity='medium',
-                                    line=1,
-                                    column=1,
-                                    message=f"Step {i+1} in job '{job_name}' has no action",
-                                    suggestion="Add 'uses' for actions or 'run' for shell commands"
-                                ))
-        
-        return issues
+                    elif 'uses' not in step and 'run' not in step:
+                        schema_issues.append(YAMLIssue(
+                            type='schema',
+                            severity='medium',
+                            line=1,
+                            column=1,
+                            message=f"Step {i+1} in job '{job_name}' has no action",
+                            suggestion="Add 'uses' for actions or 'run' for shell commands"
+                        ))
+        
+        return structure_issues + schema_issues
     
-    def _check_common_syntax_issues(self, content: str) -> List[YAMLIssue]:
+    def _check_common_syntax_issues(
+        self,
+        content: str,
+        line_starts: Optional[List[int]] = None
+    ) -> List[YAMLIssue]:
         """
         Check for common YAML syntax issues that might not cause parse errors.
         
         Args:
             content: Raw YAML content
+            line_starts: Line start offsets of the content, computed if omitted
             
         Returns:
             List of syntax issues found
         """
-        issues = []
-        lines = content.split('\n')
+        # (line_num, rank, issue) so results keep the per-line check order
+        found: List[Tuple[int, int, YAMLIssue]] = []
+        reported = set()
+        if line_starts is None:
+            line_starts = compute_line_starts(content)
+        content_len = len(content)
         
-        for i, line in enumerate(lines):
-            line_num = i + 1
-            
-            # Check for tabs
-            if '\t' in line:
-                issues.append(YAMLIssue(
-                    type='syntax',
-                    severity='high',
-                    line=line_num,
-                    column=line.index('\t') + 1,
-                    message="Tab character found (YAML requires spaces)",
-                    suggestion="Replace all tabs with spaces (usually 2 or 4 spaces)"
-                ))
+        def line_bounds(pos: int) -> Tuple[int, int, int]:
+            index = line_index_of(line_starts, pos)
+            end = line_starts[index + 1] - 1 if index + 1 < len(line_starts) else content_len
+            return index + 1, line_starts[index], end
+        
+        for match in self._LINE_ISSUE_RE.finditer(content):
+            kind = match.lastgroup
+            pos = match.start()
+            line_num, line_start, line_end = line_bounds(pos)
             
-            # Check for trailing spaces
-            if line.rstrip() != line:
-                issues.append(YAMLIssue(
+            if kind == 'trail':
+                found.append((line_num, 1, YAMLIssue(
                     type='syntax',
                     severity='low',
                     line=line_num,
-                    column=len(line.rstrip()) + 1,
+                    column=pos - line_start + 1,
                     message="Trailing whitespace",
                     suggestion="Remove trailing spaces from line"
-                ))
+                )))
+                # The trailing run may hold the line's first tab
+                pos = content.find('\t', pos, match.end())
+                if pos == -1:
+                    continue
+                kind = 'tab'
             
-            # Check for inconsistent quotes
-            if line.count('"') % 2 != 0:
-                issues.append(YAMLIssue(
-                    type='syntax',
-                    severity='medium',
-                    line=line_num,
-                    column=1,
-                    message="Unmatched double quote",
-                    suggestion="Check for missing closing quote"
-                ))
+            if (line_num, kind) in reported:
+                continue
+            reported.add((line_num, kind))
             
-            if line.count("'") % 2 != 0:
-                issues.append(YAMLIssue(
+            # Check for tabs
+            if kind == 'tab':
+                found.append((line_num, 0, YAMLIssue(
                     type='syntax',
-                    severity='medium',
+                    severity='high',
                     line=line_num,
-                    column=1,
-                    message="Unmatched single quote",
-                    suggestion="Check for missing closing quote"
-                ))
+                    column=pos - line_start + 1,
+                    message="Tab character found (YAML requires spaces)",
+                    suggestion="Replace all tabs with spaces (usually 2 or 4 spaces)"
+                )))
             
             # Check for common typos in GitHub Actions
-            if 'run-on:' in line:
-                issues.append(YAMLIssue(
+            elif kind == 'runon':
+                found.append((line_num, 4, YAMLIssue(
                     type='syntax',
                     severity='high',
                     line=line_num,
-                    column=line.index('run-on:') + 1,
+                    column=pos - line_start + 1,
                     message="Typo: 'run-on' should be 'runs-on'",
                     suggestion="Change 'run-on:' to 'runs-on:'"
-                ))
+                )))
             
-            if 'need:' in line and 'needs:' not in line:
-                issues.append(YAMLIssue(
+            elif kind == 'need' and content.find('needs:', line_start, line_end) == -1:
+                found.append((line_num, 5, YAMLIssue(
                     type='syntax',
                     severity='high',
                     line=line_num,
-                    column=line.index('need:') + 1,
+                    column=pos - line_start + 1,
                     message="Typo: 'need' should be 'needs'",
                     suggestion="Change 'need:' to 'needs:'"
-                ))
+                )))
+        
+        # Check for inconsistent quotes
+        double_quote_lines, single_quote_lines = self._find_odd_quote_lines(content)
+        
+        for index in double_quote_lines:
+            found.append((index + 1, 2, YAMLIssue(
+                type='syntax',
+                severity='medium',
+                line=index + 1,
+                column=1,
+                message="Unmatched double quote",
+                suggestion="Check for missing closing quote"
+            )))
+        
+        for index in single_quote_lines:
+            found.append((index + 1, 3, YAMLIssue(
+                type='syntax',
+                severity='medium',
+                line=index + 1,
+                column=1,
+                message="Unmatched single quote",
+                suggestion="Check for missing closing quote"
+            )))
+        
+        found.sort(key=lambda item: (item[0], item[1]))
+        return [issue for _, _, issue in found]
+    
+    def _find_odd_quote_lines(self, content: str) -> Tuple[List[int], List[int]]:
+        """
+        Find lines with an odd number of double or single quotes.
+        
+        Args:
+            content: Raw YAML content
+            
+        Returns:
+            Tuple of (double_quote_lines, single_quote_lines) as 0-based line indices
+        """
+        if len(content) >= self.VECTORIZE_MIN_SIZE:
+            np = _load_numpy()
+            if np is not None:
+                return self._find_odd_quote_lines_vectorized(np, content)
+        
+        double_quote_lines = []
+        single_quote_lines = []
+        
+        # One C-level pass strips everything but quotes and newlines; quotes and
+        # newlines are single bytes in UTF-8, so the byte lines match str lines
+        quotes_only = content.encode('utf-8', 'surrogatepass').translate(None, self._NON_QUOTE_BYTES)
         
-        return issues
+        for index, quotes in enumerate(quotes_only.split(b'\n')):
+            if not quotes:
+                continue
+            double_quotes = quotes.count(0x22)
+            if double_quotes & 1:
+                double_quote_lines.append(index)
+            if (len(quotes) - double_quotes) & 1:
+                single_quote_lines.append(index)
+        
+        return double_quote_lines, single_quote_lines
+    
+    def _find_odd_quote_lines_vectorized(self, np: Any, content: str) -> Tuple[List[int], List[int]]:
+        """
+        NumPy version of _find_odd_quote_lines for large workflows.
+        
+        Both quote parities come from one prefix XOR over a byte view of the
+        content, so only lines that actually have a problem reach Python.
+        
+        Args:
+            np: The numpy module
+            content: Raw YAML content
+            
+        Returns:
+            Tuple of (double_quote_lines, single_quote_lines) as 0-based line indices
+        """
+        data = np.frombuffer(content.encode('utf-8', 'surrogatepass'), dtype=np.uint8)
+        # Quotes and newlines are single bytes in UTF-8, so byte lines match str lines
+        starts = np.concatenate(([0], np.flatnonzero(data == 0x0A) + 1))
+        ends = np.append(starts[1:], data.size)
+        
+        # Bit 0 flags a double quote and bit 1 a single quote
+        mask = (data == 0x22).view(np.uint8) | ((data == 0x27).view(np.uint8) << 1)
+        parity = np.concatenate((np.zeros(1, dtype=np.uint8), np.bitwise_xor.accumulate(mask)))
+        line_parity = parity[ends] ^ parity[starts]
+        
+        return np.flatnonzero(line_parity & 1).tolist(), np.flatnonzero(line_parity & 2).tolist()
     
     def fix_indentation(self, content: str) -> Tuple[str, List[str]]:
         """
@@ -409,19 +699,21 @@ class YAMLParser:
             Tuple of (fixed_content, list_of_changes_made)
         """
         changes = []
-        lines = content.split('\n')
-        fixed_lines = []
-        
-        for i, line in enumerate(lines):
-            # Replace tabs with spaces
-            if '\t' in line:
-                fixed_line = line.replace('\t', '  ')
-                fixed_lines.append(fixed_line)
-                changes.append(f"Line {i+1}: Replaced tabs with spaces")
-            else:
-                fixed_lines.append(line)
-        
-        fixed_content = '\n'.join(fixed_lines)
+        
+        pos = content.find('\t')
+        if pos == -1:
+            return content, changes
+        
+        # Record each line holding a tab, jumping to the next line after a hit
+        line_starts = compute_line_starts(content)
+        while pos != -1:
+            index = line_index_of(line_starts, pos)
+            changes.append(f"Line {index + 1}: Replaced tabs with spaces")
+            next_start = line_starts[index + 1] if index + 1 < len(line_starts) else len(content)
+            pos = content.find('\t', next_start)
+        
+        # Replace tabs with spaces
+        fixed_content = content.replace('\t', '  ')
         
         # Try to detect and fix inconsistent indentation
         # This is a simple implementation - a full version would be more sophisticated
@@ -7,13 +7,27 @@ sending them to external services like LLMs or logging systems.
 
 import re
 import logging
-from typing import List, Dict, Pattern, Tuple, Set
+from collections import OrderedDict
+from typing import List, Dict, Pattern, Tuple, Set, FrozenSet, Optional, Union
 from dataclasses import dataclass
 
+from ._compat import SLOTS
+from .line_index import line_index_of
+from .workflow_blob import WorkflowBlob
+
+try:
+    # Optional: scans for every pattern at once with a SIMD automaton
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
+# Backreferences are renumbered when a pattern is fused into the combined regex
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
 
-@dataclass
+
+@dataclass(**SLOTS)
 class RedactedSecret:
     """Represents a redacted secret found in the content."""
     pattern_name: str
@@ -84,6 +98,19 @@ class SecretsRedactor:
         "elasticsearch", "connection", "conn", "string", "uri", "url"
     }
     
+    # Number of pattern subsets whose combined regex is kept around
+    SUBSET_CACHE_SIZE = 64
+    
+    # Fragments that mark a value as a placeholder rather than a real secret
+    _PLACEHOLDER_RE = re.compile(
+        '|'.join(map(re.escape, [
+            "your", "example", "test", "demo", "sample", "placeholder",
+            "changeme", "xxxxxx", "......", "******", "dummy", "fake",
+            "<", ">", "{", "}", "[", "]", "$(", "${", "{{", "}}"
+        ])),
+        re.IGNORECASE
+    )
+    
     def __init__(self, custom_patterns: Dict[str, str] = None, additional_keywords: Set[str] = None):
         """
         Initialize the secrets redactor.
@@ -105,19 +132,43 @@ class SecretsRedactor:
             except re.error as e:
                 logger.error(f"Invalid regex pattern for {name}: {e}")
         
+        self._build_combined_pattern()
+        self._build_hyperscan_database()
+        
         # Combine keywords
         self.sensitive_keywords = self.SENSITIVE_KEYWORDS.copy()
         if additional_keywords:
             self.sensitive_keywords.update(additional_keywords)
         
+        # Pattern to find key-value pairs in YAML; longest keywords first so the
+        # most specific key is reported, e.g. 'apikey' rather than 'api'
+        keywords = sorted(self.sensitive_keywords, key=lambda k: (-len(k), k))
+        self._sensitive_value_pattern = re.compile(
+            rf"({'|'.join(map(re.escape, keywords))})['\"]?\s*:\s*['\"]?([^\s'\"]+)['\"]?",
+            re.IGNORECASE | re.MULTILINE
+        )
+        
+        # Any key the pattern can match contains one of these keywords, so content
+        # without them can skip the pattern; keywords containing another are redundant
+        lowered = {keyword.lower() for keyword in self.sensitive_keywords}
+        self._keyword_probe = tuple(sorted(
+            keyword for keyword in lowered
+            if not any(other != keyword and other in keyword for other in lowered)
+        ))
+        
         logger.debug(f"Initialized with {len(self.patterns)} patterns and {len(self.sensitive_keywords)} keywords")
     
-    def redact_content(self, content: str, replacement: str = "[REDACTED]") -> Tuple[str, List[RedactedSecret]]:
+    def redact_content(
+        self,
+        content: Union[str, WorkflowBlob],
+        replacement: str = "[REDACTED]"
+    ) -> Tuple[str, List[RedactedSecret]]:
         """
         Redact all detected secrets in the content.
         
         Args:
-            content: The content to redact
+            content: The content to redact, or a WorkflowBlob shared with other
+                passes over the same content
             replacement: The replacement string for redacted values
             
         Returns:
@@ -125,58 +176,307 @@ class SecretsRedactor:
         """
         logger.debug("Starting content redaction")
         
+        blob = content if isinstance(content, WorkflowBlob) else WorkflowBlob.from_str(content)
+        content = blob.content
+        
+        # Collect (start, end, priority, pattern_name) spans against the original
+        # content, then rewrite it once instead of replacing per secret
+        spans = self._find_pattern_matches(content)
+        
+        # Also check for sensitive key-value pairs
+        spans.extend(self._redact_sensitive_values(content, replacement))
+        
+        # Identical spans found by several patterns collapse to the first pattern's
+        unique_spans: Dict[Tuple[int, int], Tuple[int, str]] = {}
+        for start_pos, end_pos, priority, pattern_name in spans:
+            existing = unique_spans.get((start_pos, end_pos))
+            if existing is None or priority < existing[0]:
+                unique_spans[(start_pos, end_pos)] = (priority, pattern_name)
+        
+        # Earliest span first; ties go to the pattern listed first
+        detected: List[Tuple[int, int, Optional[str]]] = [
+            (start_pos, end_pos, pattern_name)
+            for (start_pos, end_pos), (_, pattern_name)
+            in sorted(unique_spans.items(), key=lambda item: (item[0][0], item[1][0]))
+        ]
+        
+        # Other copies of a detected value are redacted too, without a record of
+        # their own; on a tie the detected span sorts first
+        ordered_spans = detected + self._find_value_copies(content, detected)
+        ordered_spans.sort(key=lambda span: (span[0], span[2] is None))
+        
+        # Only index lines when there is something to locate
+        line_starts = blob.line_starts if ordered_spans else []
         redacted_secrets: List[RedactedSecret] = []
-        redacted_content = content
+        # Overlapping spans merge into one redacted region, so no part of
+        # either value is left in plain text
+        regions: List[List[int]] = []
+        recorded_end = -1
+        
+        for start_pos, end_pos, pattern_name in ordered_spans:
+            if regions and start_pos < regions[-1][1]:
+                regions[-1][1] = max(regions[-1][1], end_pos)
+            else:
+                regions.append([start_pos, end_pos])
+            
+            # Copies aren't reported, nor are spans nested in a reported one
+            if pattern_name is None or end_pos <= recorded_end:
+                continue
+            recorded_end = end_pos
+            
+            # Calculate line and column
+            line_num, col_start, col_end = self._get_position_info(line_starts, start_pos, end_pos)
+            
+            # Create redacted secret record
+            redacted_secrets.append(RedactedSecret(
+                pattern_name=pattern_name,
+                original_value=content[start_pos:end_pos],
+                redacted_value=replacement,
+                line_number=line_num,
+                column_start=col_start,
+                column_end=col_end
+            ))
+            
+            logger.info(f"🔒 Redacted {pattern_name} on line {line_num}")
         
-        # Split content into lines for line number tracking
-        lines = content.split('\n')
+        parts: List[str] = []
+        cursor = 0
+        for start_pos, end_pos in regions:
+            parts.append(content[cursor:start_pos])
+            parts.append(replacement)
+            cursor = end_pos
         
-        # Apply each pattern
-        for pattern_name, pattern in self.patterns.items():
-            matches = list(pattern.finditer(content))
+        parts.append(content[cursor:])
+        redacted_content = ''.join(parts)
+        
+        logger.info(f"✅ Redacted {len(redacted_secrets)} secrets")
+        return redacted_content, redacted_secrets
+    
+    def _find_value_copies(
+        self,
+        content: str,
+        spans: List[Tuple[int, int, Optional[str]]]
+    ) -> List[Tuple[int, int, Optional[str]]]:
+        """
+        Find every other occurrence of the values covered by spans.
+        
+        A secret detected once, e.g. after "password:", may be repeated where no
+        pattern would recognize it, such as inside a run command.
+        
+        Args:
+            content: The content being redacted
+            spans: Accepted (start, end, pattern_name) spans
+            
+        Returns:
+            (start, end, None) spans for the occurrences not already in spans
+        """
+        if not spans:
+            return []
+        
+        known = {(start_pos, end_pos) for start_pos, end_pos, _ in spans}
+        values = {content[start_pos:end_pos] for start_pos, end_pos in known}
+        # Longest first so a value containing another is matched whole
+        values_pattern = re.compile('|'.join(
+            map(re.escape, sorted(values, key=lambda value: (-len(value), value)))
+        ))
+        return [
+            (match.start(), match.end(), None)
+            for match in values_pattern.finditer(content)
+            if (match.start(), match.end()) not in known
+        ]
+    
+    def _build_combined_pattern(self) -> None:
+        """
+        Fuse the compiled patterns into a single alternation.
+        
+        The alternation only locates positions where some pattern matches, so
+        stretches of content without candidates are skipped in one C-level
+        search instead of one per pattern. Patterns carrying named groups or
+        backreferences would break once renumbered, so they are scanned alone,
+        as are patterns that don't compile inside the alternation.
+        """
+        self._combinable_patterns: List[Tuple[int, str, Pattern]] = []
+        self._standalone_patterns: List[Tuple[int, str, Pattern]] = []
+        # Combined regexes for the subsets of patterns hyperscan reports as present
+        self._subset_patterns: "OrderedDict[FrozenSet[int], Optional[Pattern]]" = OrderedDict()
+        
+        for priority, (name, pattern) in enumerate(self.patterns.items()):
+            if pattern.groupindex or _BACKREF_RE.search(pattern.pattern):
+                self._standalone_patterns.append((priority, name, pattern))
+                continue
             
-            for match in matches:
-                # Get the matched value
-                if match.groups():
-                    # If pattern has groups, use the first group
-                    secret_value = match.group(1)
-                    start_pos = match.start(1)
-                    end_pos = match.end(1)
-                else:
-                    # Otherwise use the whole match
-                    secret_value = match.group(0)
-                    start_pos = match.start()
-                    end_pos = match.end()
+            # Some patterns, e.g. ones opening with a global (?i) flag, only
+            # compile at the start of a regex; keep them out of the alternation
+            try:
+                self._fuse_patterns([(priority, name, pattern)])
+            except re.error as e:
+                logger.debug(f"Scanning secret pattern {name} separately: {e}")
+                self._standalone_patterns.append((priority, name, pattern))
+            else:
+                self._combinable_patterns.append((priority, name, pattern))
+        
+        try:
+            self._combined_pattern = self._fuse_patterns(self._combinable_patterns)
+        except re.error as e:
+            logger.debug(f"Could not combine secret patterns, scanning separately: {e}")
+            self._combined_pattern = None
+            self._combinable_patterns = []
+            self._standalone_patterns = [
+                (priority, name, pattern)
+                for priority, (name, pattern) in enumerate(self.patterns.items())
+            ]
+    
+    @staticmethod
+    def _fuse_patterns(entries: List[Tuple[int, str, Pattern]]) -> Optional[Pattern]:
+        """
+        Compile (priority, name, pattern) entries into one alternation.
+        
+        Args:
+            entries: Patterns to fuse, in priority order
+            
+        Returns:
+            Combined pattern, or None if there are no entries
+        """
+        if not entries:
+            return None
+        return re.compile(
+            '|'.join(f"(?:{pattern.pattern})" for _, _, pattern in entries),
+            re.IGNORECASE | re.MULTILINE
+        )
+    
+    def _build_hyperscan_database(self) -> None:
+        """
+        Compile every pattern into a hyperscan database when it is installed.
+        
+        The database only reports which patterns occur in the content; the
+        regexes above still locate the secrets, so hyperscan acts as a prefilter
+        that lets files without secrets skip the Python scan entirely.
+        """
+        self._hyperscan_db = None
+        if hyperscan is None or not self.patterns:
+            return
+        
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SINGLEMATCH
+        database = hyperscan.Database()
+        try:
+            database.compile(
+                expressions=[pattern.pattern.encode() for pattern in self.patterns.values()],
+                ids=list(range(len(self.patterns))),
+                elements=len(self.patterns),
+                flags=[flags] * len(self.patterns)
+            )
+        except hyperscan.error as e:
+            logger.debug(f"Hyperscan could not compile secret patterns, using regex only: {e}")
+            return
+        
+        self._hyperscan_db = database
+    
+    def _present_pattern_ids(self, content: str) -> FrozenSet[int]:
+        """
+        Scan the content once with hyperscan.
+        
+        Args:
+            content: ASCII content to scan
+            
+        Returns:
+            Priorities of the patterns that match somewhere in the content
+        """
+        hits: Set[int] = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(pattern_id)
+        
+        self._hyperscan_db.scan(content.encode('ascii'), match_event_handler=on_match)
+        return frozenset(hits)
+    
+    def _combined_for(self, present: FrozenSet[int]) -> Optional[Pattern]:
+        """
+        Get the combined regex restricted to the patterns present in the content.
+        
+        Args:
+            present: Priorities reported by hyperscan
+            
+        Returns:
+            Combined pattern as built by _fuse_patterns
+        """
+        key = frozenset(entry[0] for entry in self._combinable_patterns if entry[0] in present)
+        cached = self._subset_patterns.get(key)
+        if cached is not None:
+            self._subset_patterns.move_to_end(key)
+        else:
+            cached = self._fuse_patterns([entry for entry in self._combinable_patterns if entry[0] in key])
+            self._subset_patterns[key] = cached
+            if len(self._subset_patterns) > self.SUBSET_CACHE_SIZE:
+                self._subset_patterns.popitem(last=False)
+        return cached
+    
+    def _find_pattern_matches(self, content: str) -> List[Tuple[int, int, int, str]]:
+        """
+        Find secrets matched by the configured patterns.
+        
+        Args:
+            content: The content to scan
+            
+        Returns:
+            List of (start, end, priority, pattern_name) spans
+        """
+        spans = []
+        combined_pattern = self._combined_pattern
+        combined_patterns = self._combinable_patterns
+        standalone_patterns = self._standalone_patterns
+        
+        # Hyperscan's byte scan can't see Unicode case folding, so only trust it
+        # to rule patterns out on ASCII content
+        if self._hyperscan_db is not None and content.isascii():
+            present = self._present_pattern_ids(content)
+            if not present:
+                return spans
+            combined_pattern = self._combined_for(present)
+            combined_patterns = [entry for entry in combined_patterns if entry[0] in present]
+            standalone_patterns = [entry for entry in standalone_patterns if entry[0] in present]
+        
+        if combined_pattern is not None:
+            # The alternation reports one pattern per position, and a secret can
+            # sit inside another pattern's match, so every position it finds is
+            # tried against each pattern. Skipping a pattern until the end of its
+            # previous match gives exactly the matches of a finditer per pattern.
+            resume_at = {priority: 0 for priority, _, _ in combined_patterns}
+            search = combined_pattern.search
+            candidate = search(content)
+            while candidate:
+                pos = candidate.start()
+                for priority, pattern_name, pattern in combined_patterns:
+                    if resume_at[priority] > pos:
+                        continue
+                    match = pattern.match(content, pos)
+                    if match is None:
+                        continue
+                    resume_at[priority] = max(match.end(), pos + 1)
+                    
+                    # If pattern has groups, use the first group; otherwise the whole match
+                    group = 1 if pattern.groups else 0
+                    secret_value = match.group(group)
+                    
+                    # Skip if too short or looks like a placeholder
+                    if len(secret_value) < 8 or self._is_placeholder(secret_value):
+                        continue
+                    
+                    spans.append((match.start(group), match.end(group), priority, pattern_name))
+                candidate = search(content, pos + 1)
+        
+        for priority, pattern_name, pattern in standalone_patterns:
+            for match in pattern.finditer(content):
+                # If pattern has groups, use the first group; otherwise the whole match
+                group = 1 if match.groups() else 0
+                secret_value = match.group(group)
                 
                 # Skip if too short or looks like a placeholder
                 if len(secret_value) < 8 or self._is_placeholder(secret_value):
                     continue
                 
-                # Calculate line and column
-                line_num, col_start, col_end = self._get_position_info(content, start_pos, end_pos)
-                
-                # Create redacted secret record
-                redacted_secret = RedactedSecret(
-                    pattern_name=pattern_name,
-                    original_value=secret_value,
-                    redacted_value=replacement,
-                    line_number=line_num,
-                    column_start=col_start,
-                    column_end=col_end
-                )
-                redacted_secrets.append(redacted_secret)
-                
-                # Replace in content
-                redacted_content = redacted_content.replace(secret_value, replacement)
-                
-                logger.info(f"🔒 Redacted {pattern_name} on line {line_num}")
+                spans.append((match.start(group), match.end(group), priority, pattern_name))
         
-        # Also check for sensitive key-value pairs
-        redacted_content, additional_secrets = self._redact_sensitive_values(redacted_content, replacement)
-        redacted_secrets.extend(additional_secrets)
-        
-        logger.info(f"✅ Redacted {len(redacted_secrets)} secrets")
-        return redacted_content, redacted_secrets
+        return spans
     
     def _is_placeholder(self, value: str) -> bool:
         """
@@ -188,62 +488,57 @@ class SecretsRedactor:
         Returns:
             True if it looks like a placeholder
         """
-        placeholders = [
-            "your", "example", "test", "demo", "sample", "placeholder",
-            "changeme", "xxxxxx", "......", "******", "dummy", "fake",
-            "<", ">", "{", "}", "[", "]", "$(", "${", "{{", "}}"
-        ]
-        
-        value_lower = value.lower()
-        return any(ph in value_lower for ph in placeholders)
+        return self._PLACEHOLDER_RE.search(value) is not None
     
-    def _get_position_info(self, content: str, start_pos: int, end_pos: int) -> Tuple[int, int, int]:
+    def _get_position_info(self, line_starts: List[int], start_pos: int, end_pos: int) -> Tuple[int, int, int]:
         """
         Get line number and column positions for a match.
         
         Args:
-            content: The full content
+            line_starts: Line start offsets of the full content
             start_pos: Start position of the match
             end_pos: End position of the match
             
         Returns:
             Tuple of (line_number, column_start, column_end)
         """
-        lines = content[:start_pos].split('\n')
-        line_number = len(lines)
-        column_start = len(lines[-1]) + 1 if lines else 1
+        start_line = line_index_of(line_starts, start_pos)
+        line_number = start_line + 1
+        column_start = start_pos - line_starts[start_line] + 1
         
         # Calculate end column
-        match_content = content[start_pos:end_pos]
-        if '\n' in match_content:
+        end_line = line_index_of(line_starts, end_pos)
+        if end_line != start_line:
             # Multi-line match
-            column_end = len(match_content.split('\n')[-1])
+            column_end = end_pos - line_starts[end_line]
         else:
-            column_end = column_start + len(match_content)
+            column_end = column_start + (end_pos - start_pos)
         
         return line_number, column_start, column_end
     
-    def _redact_sensitive_values(self, content: str, replacement: str) -> Tuple[str, List[RedactedSecret]]:
+    def _redact_sensitive_values(self, content: str, replacement: str) -> List[Tuple[int, int, int, str]]:
         """
-        Redact values associated with sensitive keys.
+        Find values associated with sensitive keys.
         
         Args:
             content: The content to check
             replacement: The replacement string
             
         Returns:
-            Tuple of (redacted_content, list_of_redacted_secrets)
+            List of (start, end, priority, pattern_name) spans to redact
         """
-        redacted_secrets = []
-        redacted_content = content
+        spans = []
         
-        # Pattern to find key-value pairs in YAML
-        yaml_pattern = re.compile(
-            rf"({'|'.join(self.sensitive_keywords)})['\"]?\s*:\s*['\"]?([^\s'\"]+)['\"]?",
-            re.IGNORECASE | re.MULTILINE
-        )
+        # Plain substring checks are far cheaper than the keyword alternation;
+        # str.lower only agrees with the regex's case folding on ASCII
+        if content.isascii():
+            lowered = content.lower()
+            if not any(keyword in lowered for keyword in self._keyword_probe):
+                return spans
+        
+        priority = len(self.patterns)
         
-        for match in yaml_pattern.finditer(content):
+        for match in self._sensitive_value_pattern.finditer(content):
             key = match.group(1)
             value = match.group(2)
             
@@ -255,24 +550,10 @@ class SecretsRedactor:
             if value.startswith('$') or value.startswith('{{'):
                 continue
             
-            line_num, col_start, col_end = self._get_position_info(
-                content, match.start(2), match.end(2)
-            )
-            
-            redacted_secret = RedactedSecret(
-                pattern_name=f"sensitive_key_{key}",
-                original_value=value,
-                redacted_value=replacement,
-                line_number=line_num,
-                column_start=col_start,
-                column_end=col_end
-            )
-            redacted_secrets.append(redacted_secret)
-            
-            redacted_content = redacted_content.replace(value, replacement)
-            logger.debug(f"Redacted value for sensitive key '{key}' on line {line_num}")
+            spans.append((match.start(2), match.end(2), priority, f"sensitive_key_{key}"))
+            logger.debug(f"Found value for sensitive key '{key}'")
         
-        return redacted_content, redacted_secrets
+        return spans
     
     def get_summary(self, redacted_secrets: List[RedactedSecret]) -> str:
         """
@@ -0,0 +1,61 @@
+"""
+Workflow Blob Module
+
+Wraps workflow content together with data derived from it, so the parser
+and the secrets redactor can share one line index and content digest
+instead of each rebuilding them.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .line_index import compute_line_starts
+
+
+def content_digest(content: str) -> bytes:
+    """
+    Compute a compact digest identifying workflow content.
+    
+    Args:
+        content: Workflow content
+        
+    Returns:
+        16-byte BLAKE2b digest of the UTF-8 encoded content
+    """
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+
+
+@dataclass
+class WorkflowBlob:
+    """Workflow content whose line index and digest are computed at most once."""
+    content: str
+    _line_starts: Optional[List[int]] = field(default=None, init=False, repr=False, compare=False)
+    _digest: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    @classmethod
+    def from_str(cls, content: str) -> "WorkflowBlob":
+        """
+        Wrap workflow content.
+        
+        Args:
+            content: Workflow content
+            
+        Returns:
+            WorkflowBlob for the content
+        """
+        return cls(content)
+    
+    @property
+    def line_starts(self) -> List[int]:
+        """Line start offsets of the content, as from compute_line_starts."""
+        if self._line_starts is None:
+            self._line_starts = compute_line_starts(self.content)
+        return self._line_starts
+    
+    @property
+    def digest(self) -> bytes:
+        """Digest of the content, as from content_digest."""
+        if self._digest is None:
+            self._digest = content_digest(self.content)
+        return self._digest
@@ -6,45 +6,358 @@ This module provides the main command-line interface for the CI/CD optimization
 It handles command parsing, argument validation, and orchestrates the optimization process.
 """
 
+import os
+import re
 import sys
+import copy
+import json
+import shlex
+import queue
+import atexit
+import signal
 import logging
+import subprocess
+import logging.handlers
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from string import Template
+from typing import TYPE_CHECKING, Iterator, Optional, List, Tuple
 import typer
-from rich.console import Console
-from rich.logging import RichHandler
 
-# Import our modules (will be implemented next)
-from agent.main import CIOptimizerAgent
-from agent.config_loader import Config, load_config
+# The agent and config modules pull in heavy dependencies (pydantic, networkx,
+# jsonschema, ...), so they are imported only when a run starts; --help, --version and
+# install-hooks never need them
 from agent.exit_handler import ExitCode, handle_exit
 
-# Initialize Typer app and Rich console
+if TYPE_CHECKING:
+    from rich.console import Console
+    from agent.config_loader import Config
+
+# Initialize Typer app; the Rich console is created on first use
 app = typer.Typer(
     name="cicd-fixer",
     help="AI-powered CI/CD pipeline optimizer for GitHub Actions and GitLab CI",
     add_completion=True,
 )
-console = Console()
+_console: Optional["Console"] = None
 
 # Version information
 __version__ = "0.1.0"
 
-# Configure logging with Rich handler for beautiful output
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[RichHandler(console=console, rich_tracebacks=True)],
-)
+# Set to 1/0 to force Rich log output on or off regardless of the terminal
+PRETTY_LOGS_ENV_VAR = "CICD_FIXER_PRETTY_LOGS"
+
+# Output formats meant for other programs; logs for these are emitted as JSON
+MACHINE_OUTPUT_FORMATS = ("json", "github")
+
+# Workflow files the pre-commit hook looks for among staged changes
+HOOK_WORKFLOW_PATHSPECS = (".github/workflows/*.yml", ".github/workflows/*.yaml", ".gitlab-ci.yml")
+
+# Git hook scripts; shell variables are written as $$NAME so Template leaves them alone
+_PRE_COMMIT_HOOK_TEMPLATE = Template("""#!/bin/sh
+# CI/CD Fixer pre-commit hook: only staged workflow files are checked
+FILES=$$(git diff --cached --name-only --diff-filter=ACM -- $pathspecs)
+[ -z "$$FILES" ] && exit 0
+
+echo "🔍 Checking CI/CD configurations..."
+# One path per line; pass each as --files so spaces survive
+IFS='
+'
+set --
+for f in $$FILES; do
+    set -- "$$@" --files "$$f"
+done
+cicd-fixer --quiet --exit-on-issues "$$@"
+""")
+
+_PRE_PUSH_HOOK_TEMPLATE = Template("""#!/bin/sh
+# CI/CD Fixer pre-push hook
+echo "🔍 Final CI/CD check before push..."
+cicd-fixer --exit-on-issues
+""")
+
 logger = logging.getLogger(__name__)
 
+# Emoji for this module's log records, passed as `extra`; EmojiFormatter
+# decides whether they are shown
+_E_START = {"emoji": "🚀"}
+_E_CONFIG = {"emoji": "📋"}
+_E_AGENT = {"emoji": "🔧"}
+_E_SCAN = {"emoji": "🔍"}
+_E_HOOKS = {"emoji": "🔗"}
+_E_OK = {"emoji": "✅"}
+_E_WARN = {"emoji": "⚠️ "}
+_E_ERROR = {"emoji": "❌"}
+
+# Emoji that other modules write at the start of their messages
+_LEADING_EMOJI_RE = re.compile("^[\u2190-\u2bff\U0001F000-\U0001FAFF][\ufe0f\u200d]*\\s*")
+
+
+class EmojiFormatter(logging.Formatter):
+    """
+    Formatter that prefixes a record's `emoji` attribute to its message when enabled.
+    
+    When disabled, emoji written inline at the start of a message are
+    stripped as well, so plain output carries none from any module.
+    """
+    
+    def __init__(self, fmt: Optional[str] = None, use_emoji: bool = True):
+        """
+        Initialize the formatter.
+        
+        Args:
+            fmt: Log format string
+            use_emoji: Whether to show emoji attached to records
+        """
+        super().__init__(fmt)
+        self.use_emoji = use_emoji
+    
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Format the record, with its emoji in front of the message only if enabled."""
+        message = record.message
+        if self.use_emoji:
+            emoji = getattr(record, "emoji", None)
+            if not emoji:
+                return super().formatMessage(record)
+            record.message = f"{emoji} {message}"
+        else:
+            stripped = _LEADING_EMOJI_RE.sub("", message, count=1)
+            if stripped == message:
+                return super().formatMessage(record)
+            record.message = stripped
+        
+        try:
+            return super().formatMessage(record)
+        finally:
+            record.message = message
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter that renders each record as a single JSON object."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record as one line of JSON."""
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves all formatting to the listener's handler."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Copy the record for the queue without formatting it.
+        
+        The stock prepare() formats the message and drops exc_info, which
+        would keep Rich tracebacks and JsonFormatter's "exc" field from ever
+        seeing the exception. Only the arguments are merged, so later changes
+        to them can't alter the message.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _write_json_error(error: BaseException) -> None:
+    """Report an uncaught exception as one line of JSON on stderr."""
+    sys.stderr.write(json.dumps({"error": str(error), "type": type(error).__name__}) + "\n")
+
+
+def _get_console() -> "Console":
+    """
+    Get the shared Rich console, creating it on first use.
+    
+    Returns:
+        Console used for reports and Rich log output
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        
+        _console = Console()
+    return _console
+
+
+def __getattr__(name: str):
+    """Keep cli_entry.console working without creating it at import time."""
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Background thread that formats and writes queued log records
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_logging_configured = False
+_shutdown_registered = False
+# Handlers this module put on the root logger, removed when logging is set up again
+_root_handlers: List[logging.Handler] = []
+
+
+def _use_pretty_logs(quiet: bool, no_color: bool, output_format: str) -> bool:
+    """
+    Decide whether log records are worth rendering through Rich.
+    
+    Args:
+        quiet: Whether --quiet was given
+        no_color: Whether --no-color was given
+        output_format: Value of --format
+        
+    Returns:
+        True for an interactive console session, unless overridden by the
+        CICD_FIXER_PRETTY_LOGS environment variable
+    """
+    override = os.environ.get(PRETTY_LOGS_ENV_VAR)
+    if override is not None:
+        return override.strip().lower() in ("1", "true", "yes", "on")
+    
+    if quiet or no_color or output_format != "console":
+        return False
+    return sys.stdout.isatty()
+
+
+def setup_logging(quiet: bool = False, no_color: bool = False, output_format: str = "console") -> None:
+    """
+    Configure root logging once the command line has been parsed.
+    
+    RichHandler is much slower than a plain StreamHandler, so it is only
+    installed when its formatting will actually be seen. Machine-readable
+    output formats get JSON log lines on stderr instead; that handler runs
+    on a QueueListener thread, so callers only enqueue records. Handlers
+    writing to stdout stay synchronous, as the report is printed there from
+    the main thread and a listener thread would interleave log lines with it.
+    
+    Args:
+        quiet: Whether --quiet was given
+        no_color: Whether --no-color was given
+        output_format: Value of --format
+    """
+    global _log_listener, _logging_configured, _shutdown_registered
+    if _logging_configured:
+        return
+    _logging_configured = True
+    
+    # A previous command's handlers would keep basicConfig from installing ours
+    root = logging.getLogger()
+    for handler in _root_handlers:
+        root.removeHandler(handler)
+    _root_handlers.clear()
+    
+    use_emoji = sys.stdout.isatty() and not quiet
+    if output_format in MACHINE_OUTPUT_FORMATS:
+        # Keep stdout for the report and skip Rich (and its traceback renderer)
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(JsonFormatter())
+    elif _use_pretty_logs(quiet, no_color, output_format):
+        from rich.logging import RichHandler
+        
+        handler = RichHandler(console=_get_console(), rich_tracebacks=True)
+        handler.setFormatter(EmojiFormatter("%(message)s", use_emoji=use_emoji))
+    else:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(EmojiFormatter("%(asctime)s %(levelname)s %(message)s", use_emoji=use_emoji))
+    
+    if output_format in MACHINE_OUTPUT_FORMATS:
+        log_queue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(log_queue, handler)
+        _log_listener.start()
+        handler = _RecordQueueHandler(log_queue)
+    # Commands shut logging down when they finish; this covers any other exit
+    if not _shutdown_registered:
+        atexit.register(shutdown_logging)
+        _shutdown_registered = True
+    
+    logging.basicConfig(level=logging.INFO, handlers=[handler])
+    _root_handlers.append(handler)
+
+
+def shutdown_logging() -> None:
+    """
+    Drain queued log records and flush the console.
+    
+    Records logged afterwards go straight to the listener's handler until
+    logging is set up again. Safe to call more than once, so a command's teardown and
+    the atexit hook don't clash.
+    """
+    global _log_listener, _logging_configured
+    _logging_configured = False
+    listener, _log_listener = _log_listener, None
+    if listener is not None:
+        listener.stop()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if isinstance(handler, _RecordQueueHandler) and handler.queue is listener.queue:
+                root.removeHandler(handler)
+        for handler in listener.handlers:
+            root.addHandler(handler)
+            _root_handlers.append(handler)
+    
+    if _console is not None:
+        _console.file.flush()
+
+
+@contextmanager
+def _command_session(
+    quiet: bool = False,
+    no_color: bool = False,
+    output_format: str = "console",
+) -> Iterator[None]:
+    """
+    Set up logging and Ctrl-C handling for a command and tear them down once.
+    
+    handle_exit raises SystemExit from many places; the finally clause makes
+    sure queued log records are written exactly once whichever path exits,
+    and puts back the SIGINT handler the command replaced. With a machine
+    output format, an uncaught error is reported as JSON on stderr and ends
+    the run with FATAL_ERROR rather than printing a traceback.
+    
+    Args:
+        quiet: Whether --quiet was given
+        no_color: Whether --no-color was given
+        output_format: Value of --format
+    """
+    setup_logging(quiet=quiet, no_color=no_color, output_format=output_format)
+    previous_sigint = signal.signal(signal.SIGINT, _handle_sigint)
+    try:
+        yield
+    except Exception as e:
+        if output_format not in MACHINE_OUTPUT_FORMATS:
+            raise
+        _write_json_error(e)
+        handle_exit(ExitCode.FATAL_ERROR)
+    finally:
+        shutdown_logging()
+        signal.signal(signal.SIGINT, previous_sigint)
+
+
+def _handle_sigint(signum: int, frame) -> None:
+    """
+    Exit on Ctrl-C.
+    
+    Further interrupts are ignored so repeated Ctrl-C can't cut the shutdown
+    (and the draining of queued log records) short.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logger.warning("Operation cancelled by user", extra=_E_WARN)
+    handle_exit(ExitCode.USER_CANCELLED)
+
 
 def version_callback(value: bool) -> None:
     """Display version information and exit."""
     if value:
-        console.print(f"[bold blue]CI/CD Fixer[/bold blue] version {__version__}")
-        console.print("AI-powered CI/CD pipeline optimizer")
-        console.print("For more info: https://github.com/cicd-fixer/cicd-fixer")
+        # Plain write; no need to run Rich's markup and render pipeline here
+        sys.stdout.write(
+            f"CI/CD Fixer version {__version__}\n"
+            "AI-powered CI/CD pipeline optimizer\n"
+            "For more info: https://github.com/cicd-fixer/cicd-fixer\n"
+        )
         raise typer.Exit(0)
 
 
@@ -54,18 +367,17 @@ def main(
     path: Optional[Path] = typer.Argument(
         None,
         help="Path to analyze (defaults to current directory)",
-        exists=True,
-        file_okay=True,
-        dir_okay=True,
     ),
     file: Optional[Path] = typer.Option(
         None,
         "--file",
         "-f",
         help="Specific workflow file to analyze",
-        exists=True,
-        file_okay=True,
-        dir_okay=False,
+    ),
+    files: Optional[List[Path]] = typer.Option(
+        None,
+        "--files",
+        help="Workflow file to analyze; repeat to analyze several (skips workflow discovery)",
     ),
     # Mode options
     autofix: bool = typer.Option(
@@ -92,9 +404,6 @@ def main(
         "--config",
         "-c",
         help="Path to configuration file (default: .cicd-fixer.yml)",
-        exists=True,
-        file_okay=True,
-        dir_okay=False,
     ),
     no_config: bool = typer.Option(
         False,
@@ -157,98 +466,275 @@ def main(
     By default, runs in suggestion mode on the current directory.
     Use --autofix to automatically apply suggested fixes.
     """
-    # Log startup
-    logger.info(f"🚀 Starting CI/CD Fixer v{__version__}")
-    
-    # Set up logging level based on verbosity
-    if quiet:
-        logging.getLogger().setLevel(logging.ERROR)
-    elif verbose == 0:
-        logging.getLogger().setLevel(logging.INFO)
-    elif verbose == 1:
-        logging.getLogger().setLevel(logging.DEBUG)
-    else:  # verbose >= 2
-        logging.getLogger().setLevel(logging.DEBUG)
-        # Also show debug logs from our modules
-        logging.getLogger("agent").setLevel(logging.DEBUG)
-    
-    # Disable color if requested
-    if no_color:
-        console.no_color = True
-    
-    # Determine target path
-    target_path = path or Path.cwd()
-    logger.debug(f"Target path: {target_path}")
-    
-    # Load configuration
-    try:
-        if no_config:
-            logger.info("📋 Using default configuration (--no-config specified)")
-            config_obj = Config()  # Use defaults
-        else:
-            config_path = config or target_path / ".cicd-fixer.yml"
-            logger.info(f"📋 Loading configuration from: {config_path}")
-            config_obj = load_config(config_path)
+    with _command_session(quiet=quiet, no_color=no_color, output_format=format):
+        # Set up logging level based on verbosity
+        level = logging.ERROR if quiet else (logging.DEBUG if verbose >= 1 else logging.INFO)
+        logging.getLogger().setLevel(level)
+        if verbose >= 2:
+            # Also show debug logs from our modules
+            logging.getLogger("agent").setLevel(logging.DEBUG)
+        
+        # Log startup
+        logger.info("Starting CI/CD Fixer v%s", __version__, extra=_E_START)
+        
+        # Disable color if requested
+        if no_color:
+            _get_console().no_color = True
+        
+        # Determine target path
+        target_path = path or Path.cwd()
+        logger.debug("Target path: %s", target_path)
+        _check_input_paths(target_path, file, files)
+        
+        config_obj = _load_configuration(target_path, config_path=config, no_config=no_config)
         
         # Override config with CLI arguments
+        overrides = {}
         if autofix:
-            config_obj.general.mode = "autofix"
+            overrides["general.mode"] = "autofix"
         if dry_run:
-            config_obj.autofix.dry_run = True
+            overrides["autofix.dry_run"] = True
         if yes:
-            config_obj.autofix.interactive = False
+            overrides["autofix.interactive"] = False
         if no_cloud:
-            config_obj.external_services.use_llm = False
+            overrides["external_services.use_llm"] = False
         if max_issues:
-            config_obj.output.max_issues = max_issues
+            overrides["output.max_issues"] = max_issues
         if format != "console":
-            config_obj.output.format = format
+            overrides["output.format"] = format
+        
+        try:
+            config_obj = config_obj.apply_overrides(overrides)
+        except Exception as e:
+            logger.error("Invalid command-line options: %s", e, extra=_E_ERROR)
+            handle_exit(ExitCode.FATAL_ERROR)
         
-        # Log effective configuration
-        logger.debug(f"Effective configuration: {config_obj}")
+        # Log effective configuration; rendering the whole model is only worth
+        # it when the record will be emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Effective configuration: %s", config_obj)
+        
+        _execute(
+            target_path,
+            config_obj,
+            specific_file=file,
+            specific_files=files,
+            exit_on_issues=exit_on_issues,
+        )
+
+
+def _check_input_paths(
+    target_path: Path,
+    specific_file: Optional[Path] = None,
+    specific_files: Optional[List[Path]] = None,
+) -> None:
+    """
+    Exit if the target path or an explicitly named workflow file is missing.
+    
+    Paths aren't pre-checked by Typer, and a mistyped path would otherwise
+    end in an empty, successful run that lets a CI gate pass. Exits with
+    FILE_ERROR, as _load_configuration does for a missing --config.
+    
+    Args:
+        target_path: Directory or file being analyzed
+        specific_file: Value of --file
+        specific_files: Values of --files
+    """
+    problems = [] if target_path.exists() else [("No such file or directory: %s", target_path)]
+    explicit_files = ([specific_file] if specific_file else []) + list(specific_files or [])
+    for explicit_file in explicit_files:
+        if explicit_file.is_dir():
+            problems.append(("Expected a workflow file, got a directory: %s", explicit_file))
+        elif not explicit_file.is_file():
+            problems.append(("No such file or directory: %s", explicit_file))
+    
+    for message, problem_path in problems:
+        logger.error(message, problem_path, extra=_E_ERROR)
+    if problems:
+        handle_exit(ExitCode.FILE_ERROR)
+
+
+def _load_configuration(
+    target_path: Path,
+    config_path: Optional[Path] = None,
+    no_config: bool = False,
+) -> "Config":
+    """
+    Load the configuration for a run, exiting if it can't be loaded.
+    
+    Args:
+        target_path: Directory being analyzed
+        config_path: Explicit configuration file (default: .cicd-fixer.yml in target_path)
+        no_config: Use the default configuration without reading any file
+        
+    Returns:
+        Loaded configuration
+    """
+    try:
+        from agent.config_loader import Config
+        
+        if no_config:
+            logger.info("Using default configuration (--no-config specified)", extra=_E_CONFIG)
+            return Config()  # Use defaults
+        
+        if config_path is not None and not config_path.is_file():
+            # Paths aren't pre-checked by Typer, so an explicit --config is checked here
+            logger.error("Configuration file not found: %s", config_path, extra=_E_ERROR)
+            handle_exit(ExitCode.FILE_ERROR)
+        
+        config_path = config_path or target_path / ".cicd-fixer.yml"
+        if not config_path.is_file():
+            # Common for hook runs; skip the file entirely but keep env overrides
+            logger.info("No configuration file at %s, using defaults", config_path, extra=_E_CONFIG)
+            return _cached_load_config(None)
+        
+        logger.info("Loading configuration from: %s", config_path, extra=_E_CONFIG)
+        return _cached_load_config(config_path)
         
     except Exception as e:
-        logger.error(f"❌ Failed to load configuration: {e}")
+        logger.error("Failed to load configuration: %s", e, extra=_E_ERROR)
         handle_exit(ExitCode.FATAL_ERROR)
+
+
+@lru_cache(maxsize=8)
+def _load_config_for_key(
+    config_path: Optional[str],
+    mtime_ns: Optional[int],
+    env: Tuple[Tuple[str, str], ...],
+) -> "Config":
+    """
+    Load a configuration file once per (path, mtime, environment) key.
+    
+    Args:
+        config_path: Configuration file path, or None for the defaults
+        mtime_ns: Modification time of the file, or None if there is none
+        env: CICD_FIXER_* environment variables, which load_config merges in
+        
+    Returns:
+        Loaded configuration (shared; callers must copy before changing it)
+    """
+    from agent.config_loader import load_config
+    
+    return load_config(config_path)
+
+
+def _cached_load_config(config_path: Optional[Path]) -> "Config":
+    """
+    Load a configuration file, reusing the parsed result while it is unchanged.
+    
+    Args:
+        config_path: Configuration file path, or None for the defaults plus
+            environment overrides
+        
+    Returns:
+        Private copy of the loaded configuration
+    """
+    mtime_ns = None
+    if config_path is not None:
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
+            pass
     
+    env = tuple(sorted(
+        (name, value) for name, value in os.environ.items() if name.startswith("CICD_FIXER_")
+    ))
+    path_key = str(config_path) if config_path is not None else None
+    return _load_config_for_key(path_key, mtime_ns, env).model_copy(deep=True)
+
+
+def _execute(
+    target_path: Path,
+    config_obj: "Config",
+    specific_file: Optional[Path] = None,
+    specific_files: Optional[List[Path]] = None,
+    exit_on_issues: bool = False,
+) -> None:
+    """
+    Run the optimizer agent and exit with the matching code.
+    
+    Shared by the main and check commands so neither has to re-enter the
+    other through Typer.
+    
+    Args:
+        target_path: Directory to analyze
+        config_obj: Effective configuration
+        specific_file: Single workflow file to analyze instead of discovering them
+        specific_files: Workflow files to analyze instead of discovering them
+        exit_on_issues: Exit with ISSUES_FOUND when any issue is reported
+    """
     # Initialize the optimizer agent
     try:
-        logger.info("🔧 Initializing CI Optimizer Agent...")
+        logger.info("Initializing CI Optimizer Agent...", extra=_E_AGENT)
+        from agent.main import CIOptimizerAgent
+        
         agent = CIOptimizerAgent(
             config=config_obj,
             target_path=target_path,
-            specific_file=file,
-            console=console,
+            specific_file=specific_file,
+            specific_files=specific_files,
+            console=_get_console(),
         )
     except Exception as e:
-        logger.error(f"❌ Failed to initialize agent: {e}")
+        logger.error("Failed to initialize agent: %s", e, extra=_E_ERROR)
         handle_exit(ExitCode.FATAL_ERROR)
     
     # Run the optimization process
     try:
-        logger.info("🔍 Analyzing CI/CD configurations...")
+        logger.info("Analyzing CI/CD configurations...", extra=_E_SCAN)
         issues_found = agent.run()
         
         # Determine exit code
         if issues_found > 0 and exit_on_issues:
-            logger.info(f"⚠️  Found {issues_found} issue(s)")
+            logger.info("Found %d issue(s)", issues_found, extra=_E_WARN)
             handle_exit(ExitCode.ISSUES_FOUND)
         elif issues_found > 0:
-            logger.info(f"✅ Analysis complete. Found {issues_found} issue(s)")
+            logger.info("Analysis complete. Found %d issue(s)", issues_found, extra=_E_OK)
             handle_exit(ExitCode.SUCCESS)
         else:
-            logger.info("✅ No issues found! Your CI/CD configuration looks good.")
+            logger.info("No issues found! Your CI/CD configuration looks good.", extra=_E_OK)
             handle_exit(ExitCode.SUCCESS)
             
-    except KeyboardInterrupt:
-        logger.warning("\n⚠️  Operation cancelled by user")
-        handle_exit(ExitCode.FATAL_ERROR)
     except Exception as e:
-        logger.error(f"❌ Unexpected error: {e}")
-        logger.debug("Full traceback:", exc_info=True)
+        logger.error("Unexpected error: %s", e, extra=_E_ERROR)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Full traceback:", exc_info=True)
         handle_exit(ExitCode.FATAL_ERROR)
 
 
+def _write_hook(hook_path: Path, content: str, force: bool) -> bool:
+    """
+    Write an executable hook script.
+    
+    The file is created with its final mode in one call, and without force
+    O_EXCL makes the existence check part of that same call.
+    
+    Args:
+        hook_path: Where to write the hook
+        content: Hook script
+        force: Overwrite an existing hook
+        
+    Returns:
+        False if the hook already exists and force is off, True otherwise
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    if not force:
+        flags |= os.O_EXCL
+    
+    try:
+        fd = os.open(hook_path, flags, 0o755)
+    except FileExistsError:
+        return False
+    
+    with os.fdopen(fd, "wb") as hook_file:
+        # The creation mode only applies to new files; an overwritten hook
+        # keeps its old mode unless it is set again
+        if force and hasattr(os, "fchmod"):
+            os.fchmod(fd, 0o755)
+        hook_file.write(content.encode())
+    return True
+
+
 @app.command()
 def install_hooks(
     pre_commit: bool = typer.Option(True, help="Install pre-commit hook"),
@@ -256,69 +742,69 @@ def install_hooks(
     force: bool = typer.Option(False, help="Overwrite existing hooks"),
 ) -> None:
     """Install git hooks for automatic CI/CD checking."""
-    logger.info("🔗 Installing git hooks...")
+    with _command_session():
+        _install_hooks(pre_commit, pre_push, force)
+
+
+def _install_hooks(pre_commit: bool, pre_push: bool, force: bool) -> None:
+    """
+    Install the requested git hooks.
+    
+    Args:
+        pre_commit: Install the pre-commit hook
+        pre_push: Install the pre-push hook
+        force: Overwrite existing hooks
+    """
+    logger.info("Installing git hooks...", extra=_E_HOOKS)
+    
+    # Ask git where hooks live: .git may be a file (worktrees, submodules) and
+    # core.hooksPath can move the directory elsewhere
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--git-path", "hooks"],
+            capture_output=True,
+            text=True,
+        )
+    except OSError as e:
+        logger.error("Could not run git: %s", e, extra=_E_ERROR)
+        handle_exit(ExitCode.FATAL_ERROR)
     
-    git_dir = Path(".git")
-    if not git_dir.exists():
-        logger.error("❌ Not in a git repository!")
+    if result.returncode != 0:
+        logger.error("Not in a git repository!", extra=_E_ERROR)
         handle_exit(ExitCode.FATAL_ERROR)
     
-    hooks_dir = git_dir / "hooks"
-    hooks_dir.mkdir(exist_ok=True)
+    hooks_dir = Path(result.stdout.strip())
+    hooks_dir.mkdir(parents=True, exist_ok=True)
     
     # Install pre-commit hook
     if pre_commit:
-        hook_path = hooks_dir / "pre-commit"
-        if hook_path.exists() and not force:
-            logger.warning(f"⚠️  Pre-commit hook already exists. Use --force to overwrite")
+        hook_content = _PRE_COMMIT_HOOK_TEMPLATE.substitute(
+            pathspecs=" ".join(map(shlex.quote, HOOK_WORKFLOW_PATHSPECS))
+        )
+        if _write_hook(hooks_dir / "pre-commit", hook_content, force):
+            logger.info("Installed pre-commit hook", extra=_E_OK)
         else:
-            hook_content = """#!/bin/sh
-# CI/CD Fixer pre-commit hook
-echo "🔍 Checking CI/CD configurations..."
-cicd-fixer --quiet --exit-on-issues
-"""
-            hook_path.write_text(hook_content)
-            hook_path.chmod(0o755)
-            logger.info("✅ Installed pre-commit hook")
+            logger.warning("Pre-commit hook already exists. Use --force to overwrite", extra=_E_WARN)
     
     # Install pre-push hook
     if pre_push:
-        hook_path = hooks_dir / "pre-push"
-        if hook_path.exists() and not force:
-            logger.warning(f"⚠️  Pre-push hook already exists. Use --force to overwrite")
+        hook_content = _PRE_PUSH_HOOK_TEMPLATE.substitute()
+        if _write_hook(hooks_dir / "pre-push", hook_content, force):
+            logger.info("Installed pre-push hook", extra=_E_OK)
         else:
-            hook_content = """#!/bin/sh
-# CI/CD Fixer pre-push hook
-echo "🔍 Final CI/CD check before push..."
-cicd-fixer --exit-on-issues
-"""
-            hook_path.write_text(hook_content)
-            hook_path.chmod(0o755)
-            logger.info("✅ Installed pre-push hook")
+            logger.warning("Pre-push hook already exists. Use --force to overwrite", extra=_E_WARN)
     
-    logger.info("✅ Git hooks installed successfully!")
+    logger.info("Git hooks installed successfully!", extra=_E_OK)
 
 
 @app.command()
 def check() -> None:
     """Alias for the main command in suggestion mode."""
-    # Just call main with default arguments
-    main(
-        path=None,
-        file=None,
-        autofix=False,
-        dry_run=False,
-        config=None,
-        no_config=False,
-        no_cloud=False,
-        verbose=0,
-        quiet=False,
-        no_color=False,
-        format="console",
-        exit_on_issues=True,
-        max_issues=None,
-        version=None,
-    )
+    with _command_session():
+        logger.info("Starting CI/CD Fixer v%s", __version__, extra=_E_START)
+        
+        target_path = Path.cwd()
+        _execute(target_path, _load_configuration(target_path), exit_on_issues=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,173 @@
+"""
+Tests for the CLI entry point.
+"""
+
+import json
+import logging
+import os
+import shutil
+import signal
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from agent.exit_handler import ExitCode
+from cli.cli_entry import EmojiFormatter, _command_session, app
+
+WORKFLOW = """\
+on: push
+jobs:
+  build:
+    runs-on: ubuntu-latest
+    steps:
+      - run: make
+"""
+
+
+def _bare_root_logger(monkeypatch):
+    """Give the CLI a root logger without pytest's capture handlers."""
+    # pytest attaches those once fixtures are set up, so call this in the test
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+
+
+@pytest.fixture
+def workflow_dir(tmp_path):
+    workflows = tmp_path / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    (workflows / "ci.yml").write_text(WORKFLOW)
+    return tmp_path
+
+
+def test_commands_restore_process_state(monkeypatch, workflow_dir):
+    _bare_root_logger(monkeypatch)
+    runner = CliRunner()
+    sigint_handler = signal.getsignal(signal.SIGINT)
+    excepthook = sys.excepthook
+
+    json_run = runner.invoke(app, ["main", str(workflow_dir), "--no-config", "--format", "json"])
+    console_run = runner.invoke(app, ["main", str(workflow_dir), "--no-config"])
+
+    assert json_run.exit_code == 0
+    assert console_run.exit_code == 0
+    # Each run logs in its own format, not the first run's
+    assert json.loads(json_run.stderr.splitlines()[0])["level"] == "INFO"
+    assert console_run.stdout.splitlines()[0].split()[2] == "INFO"
+    assert signal.getsignal(signal.SIGINT) is sigint_handler
+    assert sys.excepthook is excepthook
+
+
+def test_json_logs_carry_exception_field(monkeypatch, capsys):
+    _bare_root_logger(monkeypatch)
+
+    with _command_session(output_format="json"):
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            logging.getLogger("cicd-test").exception("Step %s failed", "build")
+
+    entry = json.loads(capsys.readouterr().err.splitlines()[-1])
+    assert entry["msg"] == "Step build failed"
+    assert "Traceback" not in entry["msg"]
+    assert entry["exc"].endswith("ValueError: bad value")
+
+
+@pytest.mark.parametrize("extra_args", [
+    ["--no-config", "--file", "missing.yml"],
+    ["--no-config", "--files", "missing.yml"],
+    ["--no-config", "--file", "."],
+    ["--config", "missing.yml"],
+])
+def test_missing_explicit_file_fails_the_run(monkeypatch, workflow_dir, extra_args):
+    _bare_root_logger(monkeypatch)
+    result = CliRunner().invoke(
+        app, ["main", str(workflow_dir), "--exit-on-issues", *extra_args]
+    )
+
+    assert result.exit_code == ExitCode.FILE_ERROR
+
+
+def test_missing_target_path_fails_the_run(monkeypatch, tmp_path):
+    _bare_root_logger(monkeypatch)
+    result = CliRunner().invoke(app, ["main", str(tmp_path / "missing"), "--no-config"])
+
+    assert result.exit_code == ExitCode.FILE_ERROR
+
+
+def test_uncaught_error_is_reported_as_json(monkeypatch, capsys):
+    _bare_root_logger(monkeypatch)
+
+    with pytest.raises(SystemExit) as exit_info:
+        with _command_session(output_format="json"):
+            raise RuntimeError("agent crashed")
+
+    assert exit_info.value.code == ExitCode.FATAL_ERROR
+    stderr = capsys.readouterr().err
+    assert "Traceback" not in stderr
+    assert {"error": "agent crashed", "type": "RuntimeError"} in [
+        json.loads(line) for line in stderr.splitlines()
+    ]
+
+
+def test_ctrl_c_exits_as_user_cancelled(monkeypatch):
+    _bare_root_logger(monkeypatch)
+
+    with pytest.raises(SystemExit) as exit_info:
+        with _command_session():
+            signal.raise_signal(signal.SIGINT)
+
+    assert exit_info.value.code == ExitCode.USER_CANCELLED
+
+
+@pytest.mark.parametrize("use_emoji, expected", [
+    (True, ["🚀 Starting", "✅ Found workflow file"]),
+    (False, ["Starting", "Found workflow file"]),
+])
+def test_emoji_are_shown_or_dropped_for_every_record(use_emoji, expected):
+    formatter = EmojiFormatter("%(message)s", use_emoji=use_emoji)
+    # One record carries its emoji as an attribute, the other writes it inline
+    tagged = logging.makeLogRecord({"msg": "Starting", "emoji": "🚀"})
+    inline = logging.makeLogRecord({"msg": "✅ Found workflow file"})
+
+    assert [formatter.format(tagged), formatter.format(inline)] == expected
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    # Hooks live wherever git says, not necessarily .git/hooks
+    subprocess.run(["git", "-C", str(tmp_path), "config", "core.hooksPath", "custom-hooks"], check=True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_install_hooks_writes_to_git_hooks_path(monkeypatch, git_repo):
+    _bare_root_logger(monkeypatch)
+    result = CliRunner().invoke(app, ["install-hooks"])
+
+    assert result.exit_code == 0
+    for name in ("pre-commit", "pre-push"):
+        hook = git_repo / "custom-hooks" / name
+        assert hook.read_text().startswith("#!/bin/sh")
+        assert os.access(hook, os.X_OK)
+    assert not (git_repo / ".git" / "hooks" / "pre-commit").exists()
+
+
+def test_install_hooks_keeps_existing_hook_unless_forced(monkeypatch, git_repo):
+    _bare_root_logger(monkeypatch)
+    hooks_dir = git_repo / "custom-hooks"
+    hooks_dir.mkdir()
+    existing = hooks_dir / "pre-commit"
+    existing.write_text("#!/bin/sh\necho mine\n")
+
+    CliRunner().invoke(app, ["install-hooks", "--no-pre-push"])
+    assert existing.read_text() == "#!/bin/sh\necho mine\n"
+
+    CliRunner().invoke(app, ["install-hooks", "--no-pre-push", "--force"])
+    assert "cicd-fixer" in existing.read_text()
+    assert os.access(existing, os.X_OK)
@@ -0,0 +1,32 @@
+"""
+Tests for the configuration loader module.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from agent.config_loader import Config
+
+
+def test_apply_overrides_replaces_nested_values():
+    config = Config()
+
+    updated = config.apply_overrides({"general.mode": "autofix", "output.max_issues": "5"})
+
+    assert updated.general.mode == "autofix"
+    # Values go through validation, so the string is coerced like file input
+    assert updated.output.max_issues == 5
+    # Untouched settings and the original object are left alone
+    assert updated.output.format == config.output.format
+    assert config.general.mode == "suggest"
+
+
+def test_apply_overrides_validates_values():
+    with pytest.raises(ValidationError, match="Invalid mode"):
+        Config().apply_overrides({"general.mode": "sometimes"})
+
+
+def test_apply_overrides_without_overrides_returns_same_config():
+    config = Config()
+
+    assert config.apply_overrides({}) is config
@@ -0,0 +1,134 @@
+"""
+Tests for the YAML parser module.
+"""
+
+import pytest
+import yaml
+
+from agent.parsers.yaml_parser import YAMLParser
+
+
+# Malformed documents whose errors libyaml and PyYAML word differently
+MALFORMED_YAML = [
+    "{{{",
+    "- a\nb: c",
+    "a:\n  - b\n  c: d",
+    "a: b\n- c",
+    "a: *x",
+    "a: [1, 2",
+    "a: 'x",
+    "key: value: other",
+    "\tkey: v",
+    "a: {b: c",
+]
+
+
+def _first_issue(content: str, loader) -> object:
+    parser = YAMLParser()
+    parser.yaml_loader = loader
+    return parser.parse_workflow(content).issues[0]
+
+
+@pytest.mark.skipif(not hasattr(yaml, "CSafeLoader"), reason="PyYAML built without libyaml")
+@pytest.mark.parametrize("content", MALFORMED_YAML)
+def test_suggestion_does_not_depend_on_loader(content):
+    python_issue = _first_issue(content, yaml.SafeLoader)
+    c_issue = _first_issue(content, yaml.CSafeLoader)
+
+    assert c_issue.suggestion == python_issue.suggestion
+
+
+@pytest.mark.skipif(not hasattr(yaml, "CSafeLoader"), reason="PyYAML built without libyaml")
+def test_undefined_alias_is_named_by_both_loaders():
+    for loader in (yaml.SafeLoader, yaml.CSafeLoader):
+        assert "'x'" in _first_issue("a: *x", loader).message
+
+
+SYNTAX_ISSUES_YAML = (
+    'name: "CI\n'
+    "on: push  \n"
+    "jobs:\n"
+    "  build:\n"
+    "    run-on: ubuntu-latest\n"
+    "\tsteps:\t\n"
+    "    need: test\n"
+    "    - run: echo 'it''s'\n"
+    "    - run: echo \"héllo' ünïcode\n"
+)
+
+
+def test_common_syntax_issues_order_and_positions():
+    issues = YAMLParser()._check_common_syntax_issues(SYNTAX_ISSUES_YAML)
+
+    assert [(i.line, i.column, i.severity, i.message) for i in issues] == [
+        (1, 1, "medium", "Unmatched double quote"),
+        (2, 9, "low", "Trailing whitespace"),
+        (5, 5, "high", "Typo: 'run-on' should be 'runs-on'"),
+        (6, 1, "high", "Tab character found (YAML requires spaces)"),
+        (6, 8, "low", "Trailing whitespace"),
+        (7, 5, "high", "Typo: 'need' should be 'needs'"),
+        (9, 1, "medium", "Unmatched double quote"),
+        (9, 1, "medium", "Unmatched single quote"),
+    ]
+
+
+def test_vectorized_quote_scan_matches_pure_python():
+    numpy = pytest.importorskip("numpy")
+    parser = YAMLParser()
+    lines = [
+        "plain line",
+        'one "double',
+        "one 'single",
+        "both \" and '",
+        "\"balanced\" 'quotes'",
+        "ünïcode \"é",
+        "",
+        "'''",
+    ]
+    content = "\n".join(lines * 50)
+
+    assert parser._find_odd_quote_lines_vectorized(numpy, content) == parser._find_odd_quote_lines(content)
+
+
+VALID_WORKFLOW = """\
+on: push
+jobs:
+  build:
+    runs-on: ubuntu-latest
+    steps:
+      - uses: actions/checkout@v4
+      - run: make
+"""
+
+INVALID_WORKFLOW = """\
+on: push
+jobs:
+  build:
+    steps:
+      - name: nothing to do
+"""
+
+
+@pytest.mark.parametrize("content", [VALID_WORKFLOW, INVALID_WORKFLOW])
+def test_compiled_schema_fast_path_matches_full_checks(content):
+    pytest.importorskip("fastjsonschema")
+    fast = YAMLParser()
+    full = YAMLParser()
+    full.COMPILED_SCHEMAS = {}
+
+    fast_result = fast.parse_workflow(content)
+    full_result = full.parse_workflow(content)
+
+    assert fast_result.issues == full_result.issues
+    assert fast_result.is_valid == full_result.is_valid
+
+
+def test_parse_cache_returns_independent_issue_lists():
+    parser = YAMLParser()
+    first = parser.parse_workflow(INVALID_WORKFLOW)
+    first.issues.clear()
+
+    second = parser.parse_workflow(INVALID_WORKFLOW)
+
+    assert second.issues
+    assert second.issues == YAMLParser().parse_workflow(INVALID_WORKFLOW).issues